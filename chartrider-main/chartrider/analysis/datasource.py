@@ -95,4 +95,4 @@ def as_datetime_array(timestamp_array: np.ndarray) -> pd.DatetimeIndex:
 
 
 def as_datestring_array(timestamp_array: np.ndarray) -> list[str]:
-    return [TimeUtils.timestamp_to_datestring(timestamp) for timestamp in timestamp_array]
+    return TimeUtils.timestamps_to_datestrings(timestamp_array)
@@ -1,10 +1,12 @@
+import os
+
 import click
 
 from chartrider.strategies import strategy_presets
 
 if __name__ == "__main__":
     click.echo(click.style("\n*** Welcome to Chartrider Backtest! ***\n", fg="bright_blue", bold=True))
-    from chartrider.core.backtest.execution.builder import build_handlers_from_prompt
+    from chartrider.core.backtest.execution.builder import run_handlers_from_prompt
 
-    for handler in build_handlers_from_prompt(strategy_presets):
-        handler.run()
+    # every backtest fetches its own candles from the exchange and the database, so only a few run at once
+    run_handlers_from_prompt(strategy_presets, max_workers=min(4, os.cpu_count() or 1))
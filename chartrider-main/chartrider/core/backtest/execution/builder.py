@@ -1,8 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Iterator
 
+from chartrider.analysis.stat import StatResult
 from chartrider.core.backtest.broker import BacktestBroker
 from chartrider.core.backtest.execution.handler import BacktestExecutionHandler
+from chartrider.core.backtest.execution.postprocessor import report_stat_result
 from chartrider.core.backtest.execution.prompt import (
     BacktestPeriod,
     prompt_backtest_periods,
@@ -50,9 +52,33 @@ def build_handler_from_preset(
     )
 
 
-def build_handlers_from_prompt(strategy_presets: list[StrategyPreset]) -> Iterator[BacktestExecutionHandler]:
+def run_handler_from_preset(
+    start: datetime, end: datetime, strategy_preset: StrategyPreset, quiet: bool = False
+) -> StatResult | None:
+    # the caller reports the result, so that the leaderboard is only ever written from one process
+    return build_handler_from_preset(start, end, strategy_preset).run(report=False, quiet=quiet)
+
+
+def run_handlers_from_prompt(strategy_presets: list[StrategyPreset], max_workers: int | None = None) -> None:
+    """
+    Runs a backtest for every chosen period and preset.
+    The backtests share no state, so each one runs in its own process with its own handler.
+    The strategies within a preset share a single account, so a preset is never split further.
+    The results are reported here one at a time, as the backtests of a period share its leaderboard file.
+    """
     periods: list[BacktestPeriod] = prompt_backtest_periods()
     presets: list[StrategyPreset] = prompt_backtest_strategies(strategy_presets)
-    for period in periods:
-        for strategy_preset in presets:
-            yield build_handler_from_preset(period.start, period.end, strategy_preset)
+    jobs = [(period.start, period.end, strategy_preset) for period in periods for strategy_preset in presets]
+
+    if len(jobs) == 1 or max_workers == 1:
+        for start, end, strategy_preset in jobs:
+            if (result := run_handler_from_preset(start, end, strategy_preset)) is not None:
+                report_stat_result(start, end, strategy_preset.name, result)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_handler_from_preset, *job, quiet=True): job for job in jobs}
+        for future in as_completed(futures):
+            start, end, strategy_preset = futures[future]
+            if (result := future.result()) is not None:
+                report_stat_result(start, end, strategy_preset.name, result)
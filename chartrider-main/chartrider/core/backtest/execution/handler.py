@@ -5,6 +5,7 @@ from devtools import debug
 from loguru import logger
 from tqdm import tqdm, trange
 
+from chartrider.analysis.stat import StatResult
 from chartrider.core.backtest.broker import BacktestBroker
 from chartrider.core.backtest.execution.postprocessor import BacktestPostprocessor
 from chartrider.core.common.execution.base import BaseExecutionHandler
@@ -28,18 +29,24 @@ class BacktestExecutionHandler(BaseExecutionHandler):
         self.end = end.astimezone()
         self.broker = broker
 
-    def postprocess(self) -> None:
+    def postprocess(self, report: bool = True) -> StatResult:
         postprocessor = BacktestPostprocessor(execution_handler=self)
-        postprocessor.process()
+        return postprocessor.process(report=report)
 
-    def setup_logger(self) -> None:
+    def setup_logger(self, quiet: bool = False) -> None:
         logger.remove()
-        logger.add(sink=lambda msg: tqdm.write(msg, end=""), colorize=True)
+        logger.add(sink=lambda msg: tqdm.write(msg, end=""), colorize=True, level="WARNING" if quiet else "DEBUG")
 
     @profile
-    def run(self) -> None:
+    def run(self, report: bool = True, quiet: bool = False) -> StatResult | None:
+        """
+        Runs the backtest and returns its statistics, or None if it was interrupted.
+        With `report=False`, the statistics are neither printed nor put on the leaderboard (see `postprocess`).
+        With `quiet=True`, the progress bar and all logs below warnings are hidden,
+        for backtests that share the terminal with others running in parallel.
+        """
         try:
-            self.setup_logger()
+            self.setup_logger(quiet=quiet)
 
             timer = debug.timer(verbose=False).start()
 
@@ -61,7 +68,7 @@ class BacktestExecutionHandler(BaseExecutionHandler):
                 self.broker.max_candles_needed_for_indicators <= self.broker.max_candles_needed
             ), "The number of candles required by the indicators is greater than your estimates."
 
-            with trange(self.broker.max_candles_needed + 1, data_length) as pbar:
+            with trange(self.broker.max_candles_needed + 1, data_length, disable=quiet) as pbar:
                 pbar.set_description("[Backtest]")
                 for i in pbar:
                     self.broker.set_length(i)
@@ -83,9 +90,9 @@ class BacktestExecutionHandler(BaseExecutionHandler):
             elapsed = round(timer.capture().elapsed(), 2)
             logger.success(f"Backtest finished successfully in {elapsed} seconds.")
 
-            self.postprocess()
+            return self.postprocess(report=report)
         except KeyboardInterrupt:
             logger.info("KeyboardInterrupt detected. Stopping backtest.")
-            return
+            return None
         finally:
             asyncio.run(self.broker.close())
@@ -1,4 +1,5 @@
 import pickle
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -32,6 +33,59 @@ if TYPE_CHECKING:
     from chartrider.core.backtest.execution.handler import BacktestExecutionHandler
 
 
+def period_string(start: datetime, end: datetime) -> str:
+    return f"{start.strftime('%Y%m%d')}-{end.strftime('%Y%m%d')}"
+
+
+def report_stat_result(start: datetime, end: datetime, preset_name: str, result: StatResult) -> None:
+    """Prints the statistics of a finished backtest and records them on the leaderboard of its period."""
+    click.echo(result.format())
+    update_leaderboard(start, end, preset_name, result)
+
+
+def update_leaderboard(start: datetime, end: datetime, preset_name: str, result: StatResult) -> None:
+    lb_columns = {
+        "rate_of_return": "Return [%]",
+        "annual_return": "Ann. Return [%]",
+        "annual_volatility": "Ann. Volat. [%]",
+        "max_drawdown": "Max. DD [%]",
+        "avg_drawdown": "Avg. DD [%]",
+        "max_drawdown_duration": "Max. DD Dur.",
+        "avg_drawdown_duration": "Avg. DD Dur.",
+        "sharpe_ratio": "Sharpe Ratio",
+        "sortino_ratio": "Sortino Ratio",
+        "risk_return_ratio": "Risk Return Ratio",
+        "upside_capture_ratio": "Upside Capture Ratio",
+        "downside_capture_ratio": "Downside Capture Ratio",
+        "beta": "Beta",
+        "alpha": "Alpha",
+        "num_trades": "Num. Trades",
+        "created_at": "Created At",
+    }
+
+    leaderboard_file_path = BACKTEST_REPORTS_PATH / period_string(start, end) / "leaderboard.csv"
+    leaderboard_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not leaderboard_file_path.exists():
+        df = pd.DataFrame(columns=list(lb_columns.values()))
+        df.index.name = "Name"
+    else:
+        df = pd.read_csv(leaderboard_file_path, index_col="Name")
+
+    for attr, col in lb_columns.items():
+        value = getattr(result, attr)
+        if isinstance(value, float):
+            if col.endswith("[%]"):
+                value *= 100
+                value = round(value, 2)
+            else:
+                value = round(value, 4)
+        df.loc[preset_name, col] = value  # type: ignore
+
+    df.sort_values(by="Sharpe Ratio", ascending=False, inplace=True)
+    df.to_csv(leaderboard_file_path, float_format="%.8f", index=True)
+
+
 class BacktestPostprocessor:
     """
     Post-processes backtest results by generating statistics and plots.
@@ -52,13 +106,7 @@ class BacktestPostprocessor:
 
     @property
     def period_string(self) -> str:
-        start = self.execution_handler.start
-        end = self.execution_handler.end
-        return f"{start.strftime('%Y%m%d')}-{end.strftime('%Y%m%d')}"
-
-    @property
-    def leaderboard_file_path(self) -> Path:
-        return BACKTEST_REPORTS_PATH / self.period_string / "leaderboard.csv"
+        return period_string(self.execution_handler.start, self.execution_handler.end)
 
     @property
     def report_file_name(self) -> str:
@@ -72,18 +120,23 @@ class BacktestPostprocessor:
         return BACKTEST_REPORTS_PATH / self.period_string / self.report_file_name
 
     def __prepare_file_dir(self):
-        self.leaderboard_file_path.parent.mkdir(parents=True, exist_ok=True)
         self.report_file_path.parent.mkdir(parents=True, exist_ok=True)
 
     @property
     def preset_name(self) -> str:
         return self.execution_handler.strategy_preset.name
 
-    def process(self) -> None:
+    def process(self, report: bool = True) -> StatResult:
+        """
+        Computes the statistics and saves the plot data of the backtest.
+        With `report=False`, printing the statistics and updating the leaderboard are left to the caller,
+        e.g. the parent process of parallel backtests, which must not write the leaderboard concurrently.
+        """
         stat_result = self.__prepare_stats()
-        click.echo(stat_result.format())
-        self.__update_leaderboard(stat_result)
+        if report:
+            report_stat_result(self.execution_handler.start, self.execution_handler.end, self.preset_name, stat_result)
         self.__save_plot_data(stat_result)
+        return stat_result
 
     def __save_plot_data(self, stat_result: StatResult) -> None:
         factory = PlotDataSourceFactory(self.execution_handler)
@@ -104,45 +157,6 @@ class BacktestPostprocessor:
         result = analyzer.compute()
         return result
 
-    def __update_leaderboard(self, result: StatResult) -> None:
-        lb_columns = {
-            "rate_of_return": "Return [%]",
-            "annual_return": "Ann. Return [%]",
-            "annual_volatility": "Ann. Volat. [%]",
-            "max_drawdown": "Max. DD [%]",
-            "avg_drawdown": "Avg. DD [%]",
-            "max_drawdown_duration": "Max. DD Dur.",
-            "avg_drawdown_duration": "Avg. DD Dur.",
-            "sharpe_ratio": "Sharpe Ratio",
-            "sortino_ratio": "Sortino Ratio",
-            "risk_return_ratio": "Risk Return Ratio",
-            "upside_capture_ratio": "Upside Capture Ratio",
-            "downside_capture_ratio": "Downside Capture Ratio",
-            "beta": "Beta",
-            "alpha": "Alpha",
-            "num_trades": "Num. Trades",
-            "created_at": "Created At",
-        }
-
-        if not self.leaderboard_file_path.exists():
-            df = pd.DataFrame(columns=list(lb_columns.values()))
-            df.index.name = "Name"
-        else:
-            df = pd.read_csv(self.leaderboard_file_path, index_col="Name")
-
-        for attr, col in lb_columns.items():
-            value = getattr(result, attr)
-            if isinstance(value, float):
-                if col.endswith("[%]"):
-                    value *= 100
-                    value = round(value, 2)
-                else:
-                    value = round(value, 4)
-            df.loc[self.preset_name, col] = value  # type: ignore
-
-        df.sort_values(by="Sharpe Ratio", ascending=False, inplace=True)
-        df.to_csv(self.leaderboard_file_path, float_format="%.8f", index=True)
-
 
 class PlotDataSourceFactory:
     def __init__(self, execution_handler: "BacktestExecutionHandler") -> None:
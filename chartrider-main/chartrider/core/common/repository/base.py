@@ -104,6 +104,15 @@ class BaseRepository(ABC):
     def get_leverage(self, symbol: Symbol) -> int:
         ...
 
+    def set_leverages(self, leverages: dict[Symbol, int]) -> None:
+        """Set the leverage of multiple symbols. Repositories may override this to batch the requests."""
+        for symbol, leverage in leverages.items():
+            self.set_leverage(symbol, leverage)
+
+    def get_leverages(self, symbols: Iterable[Symbol]) -> dict[Symbol, int]:
+        """Get the leverage of multiple symbols. Repositories may override this to batch the requests."""
+        return {symbol: self.get_leverage(symbol) for symbol in symbols}
+
     @abstractmethod
     def set_margin_mode(self, symbol: Symbol, margin_mode: MarginMode):
         ...
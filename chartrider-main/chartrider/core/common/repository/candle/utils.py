@@ -10,10 +10,7 @@ def find_holes(array: NDArray[np.int_], normalize_factor: int = 1) -> list[tuple
         # Should be sorted
         return []
 
-    holes: list[tuple[int, int]] = []
-    indices = np.where(gaps > 1)[0]
-    for i in indices:
-        hole_start = int(array[i]) * normalize_factor
-        hole_end = int(array[i + 1]) * normalize_factor
-        holes.append((hole_start, hole_end))
-    return holes
+    indices = np.flatnonzero(gaps > 1)
+    hole_starts = array[indices].astype(np.int64) * normalize_factor
+    hole_ends = array[indices + 1].astype(np.int64) * normalize_factor
+    return list(zip(hole_starts.tolist(), hole_ends.tolist()))
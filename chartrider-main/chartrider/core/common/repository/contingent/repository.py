@@ -41,6 +41,11 @@ class ContingentInfoBaseRepository(ABC):
     ) -> None:
         ...
 
+    @abstractmethod
+    def create_contingent_infos(self, items: list[tuple[str, Symbol, PositionSide]]) -> None:
+        """Create a contingent info without contingent orders for each `(order_id, symbol, side)`, all at once."""
+        ...
+
     @abstractmethod
     def get_contingent_info(self, order_id: str, symbol: Symbol) -> ContingentInfoDto | None:
         ...
@@ -98,6 +103,10 @@ class ContingentInfoInMemoryRepository(ContingentInfoBaseRepository):
             tp_execute_price=contingent_tp.price if contingent_tp else None,
         )
 
+    def create_contingent_infos(self, items: list[tuple[str, Symbol, PositionSide]]) -> None:
+        for order_id, symbol, side in items:
+            self.create_contingent_info(order_id, symbol, side)
+
     def get_contingent_info(self, order_id: str, symbol: Symbol) -> ContingentInfoDto | None:
         key = (order_id, symbol)
         return self.database.get(key, None)
@@ -165,6 +174,14 @@ class ContingentInfoDBRepository(ContingentInfoBaseRepository):
         self.session.add(contingent_info)
         self.session.commit()
 
+    def create_contingent_infos(self, items: list[tuple[str, Symbol, PositionSide]]) -> None:
+        # a single transaction, flushed as one multi-row insert
+        self.session.add_all(
+            ContingentInfo(order_id=order_id, side=side, user_id=self.user_id, symbol=symbol, testnet=self.testnet)
+            for order_id, symbol, side in items
+        )
+        self.session.commit()
+
     def get_contingent_info(self, order_id: str, symbol: Symbol) -> ContingentInfoDto | None:
         info = self.session.execute(
             select(ContingentInfo)
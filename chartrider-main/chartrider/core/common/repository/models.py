@@ -3,7 +3,7 @@ from __future__ import annotations
 import random
 import string
 from enum import Enum, StrEnum, auto
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Annotated, Any, Literal, Self, TypeVar
 
 from loguru import logger
@@ -22,6 +22,8 @@ from chartrider.utils.prettyprint import PrettyPrint, PrettyPrintMode
 from chartrider.utils.symbols import Symbol
 from chartrider.utils.timeutils import TimeUtils
 
+_IDENTIFIER_ALPHABET = string.ascii_letters + string.digits
+
 # ----------------------------------- Enums ---------------------------------- #
 
 
@@ -63,13 +65,13 @@ class OrderSide(StrEnum):
     buy = "buy"
     sell = "sell"
 
-    @property
-    def isBuy(self) -> bool:
-        return self == OrderSide.buy
+    isBuy: bool
+    isSell: bool
 
-    @property
-    def isSell(self) -> bool:
-        return self == OrderSide.sell
+    def __init__(self, side: str) -> None:
+        # plain attributes rather than properties, as these are read on every order decision
+        self.isBuy = side == "buy"
+        self.isSell = side == "sell"
 
     @property
     def opposite(self) -> OrderSide:
@@ -133,20 +135,17 @@ class PositionSide(StrEnum):
     long = "long"
     short = "short"
 
+    isLong: bool
+    isShort: bool
+
     def __init__(self, side: str) -> None:
         self.side = side.lower()
+        self.isLong = self.side == "long"
+        self.isShort = self.side == "short"
 
     def __str__(self) -> str:
         return self.side.upper()
 
-    @property
-    def isLong(self) -> bool:
-        return self == PositionSide.long
-
-    @property
-    def isShort(self) -> bool:
-        return self == PositionSide.short
-
 
 class OrderAction(StrEnum):
     open_long = "open_long"
@@ -154,6 +153,13 @@ class OrderAction(StrEnum):
     close_long = "close_long"
     close_short = "close_short"
 
+    isOpening: bool
+    isClosing: bool
+
+    def __init__(self, action: str) -> None:
+        self.isOpening = action in ("open_long", "open_short")
+        self.isClosing = action in ("close_long", "close_short")
+
     @staticmethod
     def from_side(order_side: OrderSide, position_side: PositionSide) -> OrderAction:
         if order_side == OrderSide.buy:
@@ -175,14 +181,6 @@ class OrderAction(StrEnum):
         else:
             return PositionSide.short
 
-    @cached_property
-    def isOpening(self) -> bool:
-        return self in (self.open_long, self.open_short)
-
-    @cached_property
-    def isClosing(self) -> bool:
-        return self in (self.close_long, self.close_short)
-
     def __str__(self) -> str:
         return self.value.upper()
 
@@ -263,6 +261,13 @@ class ClientOrderId(BaseModel):
             return None
         if isinstance(id, ClientOrderId):
             return id
+        return ClientOrderId._decode_str(id)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _decode_str(id: str) -> ClientOrderId | None:
+        # the same ids are decoded over and over while orders are refetched;
+        # decoded instances are shared, so they must not be modified
         try:
             strategy, timestamp, identifier = id.split("_")
             if strategy == "None":
@@ -272,6 +277,16 @@ class ClientOrderId(BaseModel):
             logger.warning(f"Failed to decode ClientOrderId {id}: {e}")
             return None
 
+    @staticmethod
+    def trusted(strategy: str | None, timestamp: int) -> ClientOrderId:
+        """
+        Create a ClientOrderId without running the pydantic validation.
+        `strategy` must have been checked with `slug_no_underscore` beforehand.
+        """
+        client_order_id = ClientOrderId.model_construct(strategy=strategy, timestamp=int(timestamp))
+        client_order_id.identifier = client_order_id.generate_random_id()
+        return client_order_id
+
     @model_validator(mode="after")
     def auto_generate_identifier(self) -> Self:
         if self.identifier is None:
@@ -280,7 +295,7 @@ class ClientOrderId(BaseModel):
 
     def generate_random_id(self) -> str:
         remaining_slots = 36 - len(self.strategy or "None") - len(str(self.timestamp)) - 2
-        return "".join(random.choices(string.ascii_letters + string.digits, k=remaining_slots))
+        return "".join(random.choices(_IDENTIFIER_ALPHABET, k=remaining_slots))
 
     def with_timestamp(self, timestamp: int) -> ClientOrderId:
         return ClientOrderId(strategy=self.strategy, timestamp=timestamp)
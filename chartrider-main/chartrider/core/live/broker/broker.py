@@ -8,6 +8,7 @@ from chartrider.core.live.io.message import (
     CommandType,
     MessageBroker,
     QueueType,
+    close_shared_connection,
     confirm,
     echo,
     route_logger_to_queue,
@@ -119,5 +120,6 @@ class LiveBroker(BaseBroker):
         if self.message_broker:
             await logger.complete()
             await self.message_broker.close()
+            await close_shared_connection()
         if self.event_monitor:
             await self.event_monitor.close()
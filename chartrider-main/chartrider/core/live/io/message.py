@@ -21,20 +21,51 @@ from pydantic import BaseModel
 from chartrider.settings import rabbitmq_settings as settings
 from chartrider.utils.log import sanitize_html
 
+# upper bound of unacknowledged messages a consumer holds at once
+CONSUMER_PREFETCH_COUNT = 128
+
+
+_shared_connection: AbstractRobustConnection | None = None
+
+
+async def get_shared_connection() -> AbstractRobustConnection:
+    """Returns the RabbitMQ connection shared by all message brokers of this process, connecting on first use."""
+    global _shared_connection
+    if _shared_connection is None or _shared_connection.is_closed:
+        connection = await connect_robust(settings.url)
+        if _shared_connection is None or _shared_connection.is_closed:
+            _shared_connection = connection
+        else:
+            # another broker connected while we were waiting
+            await connection.close()
+    return _shared_connection
+
+
+async def close_shared_connection() -> None:
+    global _shared_connection
+    if _shared_connection is None:
+        return
+    await _shared_connection.close()
+    _shared_connection = None
+
 
 class MessageBroker:
+    """
+    Each broker works on its own channel, on top of a connection shared by all brokers of the process,
+    so creating one (e.g. for a single command) does not go through a new connection handshake.
+    """
+
     def __init__(self, name: str) -> None:
         self.name = name
-        self.__connection: AbstractRobustConnection | None = None
         self.__channel: AbstractChannel | None = None
         self.__exchange: AbstractExchange | None = None
         self.__queues: dict[QueueType, AbstractQueue] = dict()
 
     async def __connect_if_needed(self):
-        if self.__connection is not None:
+        if self.__channel is not None:
             return
-        self.__connection = await connect_robust(settings.url)
-        self.__channel = await self.__connection.channel()
+        connection = await get_shared_connection()
+        self.__channel = await connection.channel()
         self.__exchange = await self.__channel.declare_exchange(self.name, auto_delete=True)
 
     async def __declare_queue_if_needed(self, queue_type: QueueType) -> AbstractQueue:
@@ -63,6 +94,10 @@ class MessageBroker:
 
     async def consume_and_wait(self, queue_type: QueueType, callback: Callable[[MessageItem], Awaitable[None]]):
         queue = await self.__declare_queue_if_needed(queue_type)
+        assert self.__channel is not None
+        # Messages are only acked once the callback returns, so this also stops the server from pushing
+        # more messages into memory while the callback is stalled.
+        await self.__channel.set_qos(prefetch_count=CONSUMER_PREFETCH_COUNT)
 
         async def callback_wrapper(message: AbstractIncomingMessage):
             async with message.process():
@@ -93,10 +128,9 @@ class MessageBroker:
         raise AssertionError("No message found")
 
     async def close(self):
-        if self.__connection is None:
+        if self.__channel is None:
             return
-        await self.__connection.close()
-        self.__connection = None
+        await self.__channel.close()
         self.__channel = None
         self.__exchange = None
         self.__queues = dict()
@@ -255,6 +255,29 @@ class LiveRepository(BaseRepository):
         assert len(positions) > 0
         return positions[0].leverage
 
+    def set_leverages(self, leverages: dict[Symbol, int]) -> None:
+        """Set the leverage of multiple symbols with concurrent requests."""
+
+        async def set_all():
+            await asyncio.gather(
+                *[
+                    asyncio.to_thread(self.binance.set_leverage, leverage, symbol=symbol)
+                    for symbol, leverage in leverages.items()
+                ]
+            )
+
+        self.event_loop.await_task(set_all())
+        logger.info(f"Leverage set to {leverages}.")
+        self.get_leverage.cache_clear()
+
+    def get_leverages(self, symbols: Iterable[Symbol]) -> dict[Symbol, int]:
+        """Get the leverage of multiple symbols with a single position request."""
+        symbols = list(symbols)
+        positions = self.fetch_positions(symbols)
+        leverages = {position.symbol: position.leverage for position in positions}
+        assert all(symbol in leverages for symbol in symbols)
+        return leverages
+
     def set_margin_mode(self, symbol: Symbol, margin_mode: MarginMode):
         self.binance.set_margin_mode(margin_mode, symbol=symbol)
 
@@ -27,6 +27,10 @@ if TYPE_CHECKING:
     from chartrider.core.common.broker.base import BaseBroker
 
 
+_OPEN_BY_SIDE = {PositionSide.long: OrderAction.open_long, PositionSide.short: OrderAction.open_short}
+_CLOSE_BY_SIDE = {PositionSide.long: OrderAction.close_long, PositionSide.short: OrderAction.close_short}
+
+
 class BaseStrategy(ABC):
     def __init__(
         self,
@@ -63,16 +67,19 @@ class BaseStrategy(ABC):
         self.broker = broker
         broker.event_monitor.did_force_liquidate.subscribe(self.did_force_liquidate)
 
+        # validate the slug once, so that client order ids can be created without validation
+        self._client_order_strategy = ClientOrderId.slug_no_underscore(self.slug)
+
     @property
     def event_monitor(self) -> EventMonitor:
         return self.broker.event_monitor
 
     @property
     def indicators(self) -> list[Indicator]:
-        return [indicator for indicator in self.__dict__.values() if isinstance(indicator, Indicator)]
+        return list(self.__indicator_registry().values())
 
     def indicator_set_length(self, length: int) -> None:
-        for indicator in self.indicators:
+        for indicator in self.__indicator_registry().values():
             indicator.set_length(length)
 
     @abstractmethod
@@ -117,7 +124,7 @@ class BaseStrategy(ABC):
 
         Note that client_order_id are set automatically.
         """
-        client_order_id = ClientOrderId(strategy=self.slug, timestamp=self.current_timestamp)
+        client_order_id = ClientOrderId.trusted(self._client_order_strategy, self.current_timestamp)
         order = self.broker.repository.create_order(
             symbol=symbol,
             action=action,
@@ -189,12 +196,18 @@ class BaseStrategy(ABC):
     def get_strategy_orders(self, symbol: Symbol) -> set[Order]:
         return self.strategy_orders[symbol].copy()
 
-    def sync_order_status(self, order: Order) -> OrderStatus:
+    def sync_order_status(self, order: Order, bucket: set[Order] | None = None) -> OrderStatus:
+        """
+        Sync the status of the given order with the repository.
+        `bucket` is the strategy order set of the order's symbol, if the caller already holds it.
+        """
         if order.status == OrderStatus.closed:
             return order.status
 
         if order.status != OrderStatus.open:
-            self.strategy_orders[order.symbol].discard(order)
+            if bucket is None:
+                bucket = self.strategy_orders[order.symbol]
+            bucket.discard(order)
             return order.status
 
         # Now the before-sync status must be open
@@ -205,7 +218,7 @@ class BaseStrategy(ABC):
         order.status = synced_order.status
         return order.status
 
-    def cancel_order(self, order: Order) -> None:
+    def cancel_order(self, order: Order, bucket: set[Order] | None = None) -> None:
         """
         Cancel an open order of this strategy.
         Note that the contingent orders are automatically canceled by the repository.
@@ -214,7 +227,9 @@ class BaseStrategy(ABC):
             return
 
         self.broker.repository.cancel_order(order)
-        self.strategy_orders[order.symbol].discard(order)
+        if bucket is None:
+            bucket = self.strategy_orders[order.symbol]
+        bucket.discard(order)
 
         self.signposter.emit_event(
             name=f"Cancelled order {order.id}",
@@ -229,8 +244,12 @@ class BaseStrategy(ABC):
                 self.cancel_all_orders(symbol)
             return
 
-        for order in list(self.strategy_orders[symbol]):
-            self.cancel_order(order)
+        orders = self.strategy_orders.get(symbol)
+        if not orders:
+            return
+
+        for order in tuple(orders):
+            self.cancel_order(order, bucket=orders)
 
     @abstractmethod
     def clear_all(self) -> None:
@@ -250,18 +269,22 @@ class BaseStrategy(ABC):
         return synced_order
 
     def did_force_liquidate(self, symbol: Symbol, side: PositionSide) -> None:
-        for order in list(self.strategy_orders[symbol]):
+        orders = self.strategy_orders.get(symbol)
+        if not orders:
+            return
+
+        for order in tuple(orders):
             if order.positionSide != side:
                 continue
 
-            order_status = self.sync_order_status(order)
+            order_status = self.sync_order_status(order, bucket=orders)
 
             if order_status == OrderStatus.closed:
-                self.strategy_orders[symbol].discard(order)
+                orders.discard(order)
                 continue
 
             if order_status == OrderStatus.open:
-                self.cancel_order(order)
+                self.cancel_order(order, bucket=orders)
                 continue
 
     def make_indicator(
@@ -289,6 +312,22 @@ class BaseStrategy(ABC):
 
         if isinstance(value, Indicator):
             value.name = name
+            self.__indicator_registry()[name] = value
+        elif name in self.__dict__.get("_indicator_registry", ()):
+            del self.__indicator_registry()[name]
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        self.__dict__.get("_indicator_registry", {}).pop(name, None)
+
+    def __indicator_registry(self) -> dict[str, Indicator]:
+        """
+        Indicators assigned to this strategy, keyed by attribute name, in assignment order.
+        It is kept in sync by `__setattr__`/`__delattr__` so that the indicators can be resized
+        every candle without scanning `__dict__`. It is created lazily, so that indicators assigned
+        before `BaseStrategy.__init__` are also registered.
+        """
+        return self.__dict__.setdefault("_indicator_registry", {})
 
 
 class EventDrivenStrategy(BaseStrategy):
@@ -323,7 +362,7 @@ class EventDrivenStrategy(BaseStrategy):
         for trade in order.trades:
             liq_order = self.create_order(
                 symbol=order.symbol,
-                action=OrderAction.close_long if order.positionSide.isLong else OrderAction.close_short,
+                action=_CLOSE_BY_SIDE[order.positionSide],
                 amount=trade.amount,
                 price=None,  # TODO: support limit order
             )
@@ -377,9 +416,8 @@ class RebalancingStrategy(BaseStrategy):
 
         # For rebalancing, we may need to open orders before the margin is released,
         # and thus, for now, we double the leverage to avoid margin error.
-        for symbol in self.symbols:
-            curr_leverge = self.broker.repository.get_leverage(symbol)
-            self.broker.repository.set_leverage(symbol, 2 * curr_leverge)
+        current_leverages = self.broker.repository.get_leverages(self.symbols)
+        self.broker.repository.set_leverages({symbol: 2 * current_leverages[symbol] for symbol in self.symbols})
 
     def fetch_positions(self) -> dict[Symbol, Position]:
         position_list = self.broker.repository.fetch_positions(self.symbols)
@@ -400,7 +438,7 @@ class RebalancingStrategy(BaseStrategy):
         if position is None:
             position = self.fetch_positions()[symbol]
 
-        action = OrderAction.close_long if position.side.isLong else OrderAction.close_short
+        action = _CLOSE_BY_SIDE[position.side]
         liq_order = self.create_order(symbol, action, position.contracts, None)  # TODO: support limit order
 
         if liq_order is None:
@@ -460,11 +498,11 @@ class RebalancingStrategy(BaseStrategy):
             return []
 
         if curr_position is None:
-            place_action = OrderAction.open_long if target_side.isLong else OrderAction.open_short
+            place_action = _OPEN_BY_SIDE[target_side]
             return [partial(self.place_order, symbol, place_action, target_amount, target_price)]
 
         if curr_position.side != target_side:
-            place_action = OrderAction.open_long if target_side.isLong else OrderAction.open_short
+            place_action = _OPEN_BY_SIDE[target_side]
             return [
                 partial(self.liquidate_position, symbol, curr_position),
                 partial(self.place_order, symbol, place_action, target_amount, target_price),
@@ -472,27 +510,9 @@ class RebalancingStrategy(BaseStrategy):
 
         curr_amount = curr_position.contracts
 
-        if target_side.isLong:
-            if curr_amount > target_amount:
-                return [
-                    partial(
-                        self.create_order, symbol, OrderAction.close_long, curr_amount - target_amount, target_price
-                    )
-                ]
-            else:
-                return [
-                    partial(self.place_order, symbol, OrderAction.open_long, target_amount - curr_amount, target_price)
-                ]
-        else:
-            if curr_amount > target_amount:
-                return [
-                    partial(
-                        self.create_order, symbol, OrderAction.close_short, curr_amount - target_amount, target_price
-                    )
-                ]
-            else:
-                return [
-                    partial(
-                        self.place_order, symbol, OrderAction.open_short, target_amount - curr_amount, target_price
-                    )
-                ]
+        if curr_amount > target_amount:
+            close_action = _CLOSE_BY_SIDE[target_side]
+            return [partial(self.create_order, symbol, close_action, curr_amount - target_amount, target_price)]
+
+        place_action = _OPEN_BY_SIDE[target_side]
+        return [partial(self.place_order, symbol, place_action, target_amount - curr_amount, target_price)]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -22,10 +22,25 @@ class Signpost(BaseModel):
 
 class Signposter:
     def __init__(self) -> None:
-        self.__signposts: dict[SignpostID, list[Signpost]] = defaultdict(list)
+        # signposts are stored in a flat, append-only list (in emission order) along with their ids
+        self.__signposts: list[Signpost] = []
+        self.__signpost_ids: list[SignpostID] = []
+        self.__begin_indices: dict[SignpostID, int] = {}
 
     def get_signposts(self) -> dict[SignpostID, list[Signpost]]:
-        return self.__signposts
+        """Signposts grouped by their id. The first signpost of each group is the beginning of the interval."""
+        grouped: dict[SignpostID, list[Signpost]] = defaultdict(list)
+        for signpost_id, signpost in self.iter_in_order():
+            grouped[signpost_id].append(signpost)
+        return grouped
+
+    def iter_in_order(self) -> Iterator[tuple[SignpostID, Signpost]]:
+        """Iterate over all signposts in the order they were emitted."""
+        return zip(self.__signpost_ids, self.__signposts)
+
+    def __append(self, signpost_id: SignpostID, signpost: Signpost) -> None:
+        self.__signpost_ids.append(signpost_id)
+        self.__signposts.append(signpost)
 
     def begin_interval(
         self,
@@ -36,7 +51,7 @@ class Signposter:
         description: str | None = None,
         **kwargs: Any,
     ):
-        if signpost_id in self.__signposts:
+        if signpost_id in self.__begin_indices:
             raise ValueError(f"Signpost {signpost_id} already exists")
         signpost = Signpost(
             name=name,
@@ -45,7 +60,8 @@ class Signposter:
             timestamp=timestamp,
             info=kwargs,
         )
-        self.__signposts[signpost_id] = [signpost]
+        self.__begin_indices[signpost_id] = len(self.__signposts)
+        self.__append(signpost_id, signpost)
 
     def end_interval(
         self,
@@ -56,9 +72,10 @@ class Signposter:
         description: str | None = None,
         **kwargs: Any,
     ) -> None:
-        if signpost_id not in self.__signposts:
+        begin_index = self.__begin_indices.get(signpost_id)
+        if begin_index is None:
             return
-        begin_signpost = self.__signposts[signpost_id][0]
+        begin_signpost = self.__signposts[begin_index]
         signpost = Signpost(
             name=name or begin_signpost.name,
             symbol=symbol,
@@ -66,7 +83,7 @@ class Signposter:
             timestamp=timestamp,
             info=kwargs,
         )
-        self.__signposts[signpost_id].append(signpost)
+        self.__append(signpost_id, signpost)
 
     def emit_event(
         self,
@@ -83,4 +100,5 @@ class Signposter:
             timestamp=timestamp,
             info=kwargs,
         )
-        self.__signposts[signpost_id] = [signpost]
+        self.__begin_indices[signpost_id] = len(self.__signposts)
+        self.__append(signpost_id, signpost)
@@ -1,5 +1,3 @@
-from contextvars import ContextVar
-
 import sqlalchemy
 from sqlalchemy import orm
 from sqlalchemy.orm import scoped_session
@@ -8,8 +6,6 @@ from chartrider.settings import postgres_settings as db_config
 
 
 class DBSessionFactory:
-    __session_ctx: ContextVar[orm.Session] = ContextVar("session")
-
     def __init__(self):
         self.__engine: sqlalchemy.Engine = sqlalchemy.create_engine(
             db_config.url,
@@ -20,11 +16,8 @@ class DBSessionFactory:
         self.__make_scoped_session = scoped_session(self.__session_maker)
 
     def scoped_session(self) -> orm.Session:
-        session = DBSessionFactory.__session_ctx.get(None)
-        if session is None:
-            session = self.__make_scoped_session()
-            DBSessionFactory.__session_ctx.set(session)
-        return session
+        # the scoped_session registry already keys and caches the session per thread
+        return self.__make_scoped_session()
 
     def teardown(self):
         orm.close_all_sessions()
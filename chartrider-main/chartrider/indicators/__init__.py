@@ -1,5 +1,6 @@
 from chartrider.indicators.ta import TA
 
+from .rolling import RollingCache
 from .supertrend import supertrend
 
-__all__ = ["supertrend", "TA"]
+__all__ = ["supertrend", "RollingCache", "TA"]
@@ -0,0 +1,82 @@
+from typing import Hashable, Literal
+
+import numpy as np
+import pandas as pd
+
+RollingMethod = Literal["mean", "max", "min", "sum"]
+
+
+class RollingCache:
+    """
+    Caches rolling-window aggregates across `update_indicators` calls.
+
+    Asking again for the same candles returns the cached result, so strategies that share a cache
+    (e.g. several instances of one strategy on the same symbol) compute each aggregate only once.
+    When the input only gained new candles since the previous call (and possibly lost some from the head,
+    as the live broker truncates its data), only the rows after the last cached one are recomputed,
+    which bounds the work by the window size instead of the full history.
+    The last cached row is always recomputed, since the candle it came from may still have been forming.
+    """
+
+    def __init__(self) -> None:
+        self.__entries: dict[tuple[Hashable, int, RollingMethod], tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+    def mean(self, key: Hashable, df: pd.DataFrame, window: int) -> pd.DataFrame:
+        return self.rolling(key, df, window, "mean")
+
+    def max(self, key: Hashable, df: pd.DataFrame, window: int) -> pd.DataFrame:
+        return self.rolling(key, df, window, "max")
+
+    def min(self, key: Hashable, df: pd.DataFrame, window: int) -> pd.DataFrame:
+        return self.rolling(key, df, window, "min")
+
+    def rolling(self, key: Hashable, df: pd.DataFrame, window: int, method: RollingMethod) -> pd.DataFrame:
+        entry_key = (key, window, method)
+        entry = self.__entries.get(entry_key)
+        if entry is not None and _same_data(entry[0], df):
+            return entry[1]
+        result = _extend(*entry, df, window, method) if entry is not None else None
+        if result is None:
+            result = getattr(df.rolling(window), method)()
+        self.__entries[entry_key] = (df, result)
+        return result
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+
+def _same_data(cached_df: pd.DataFrame, df: pd.DataFrame) -> bool:
+    return (
+        cached_df.shape == df.shape
+        and not df.empty
+        and df.columns.equals(cached_df.columns)
+        and cached_df.index[0] == df.index[0]
+        and cached_df.index[-1] == df.index[-1]
+        and np.array_equal(cached_df.to_numpy(), df.to_numpy(), equal_nan=True)
+    )
+
+
+def _extend(
+    cached_df: pd.DataFrame, cached_result: pd.DataFrame, df: pd.DataFrame, window: int, method: RollingMethod
+) -> pd.DataFrame | None:
+    """Returns the rolling aggregate of `df` reusing `cached_result`, or None if the two inputs do not line up."""
+    if df.empty or cached_df.empty or not df.columns.equals(cached_df.columns):
+        return None
+
+    offset = int(cached_df.index.searchsorted(df.index[0]))
+    if offset >= len(cached_df) or cached_df.index[offset] != df.index[0]:
+        return None
+
+    # the last cached row is dropped, as its candle may have been updated since
+    reusable = min(len(cached_df) - offset - 1, len(df))
+    if reusable <= 0 or cached_df.index[offset + reusable - 1] != df.index[reusable - 1]:
+        return None
+
+    tail_input = df.iloc[max(0, reusable - window + 1) :]
+    tail = getattr(tail_input.rolling(window), method)().iloc[len(tail_input) - (len(df) - reusable) :]
+    result = pd.concat([cached_result.iloc[offset : offset + reusable], tail])
+
+    # keep the warm-up rows empty, exactly as if the truncated input had been aggregated from scratch
+    if offset > 0:
+        result.iloc[: window - 1] = np.nan
+    return result
@@ -1,8 +1,6 @@
 import numpy as np
 from pydantic import BaseModel, ConfigDict
 
-from chartrider.indicators.ta import TA
-
 
 class SupertrendResult(BaseModel):
     upper_band: np.ndarray
@@ -49,45 +47,70 @@ def supertrend(
     ```
     """
 
-    if reference is None:
-        reference = (high + low) / 2
+    upper_band, lower_band, trend = _supertrend_loop(high, low, close, period, atr_multiplier, reference)
+    return SupertrendResult(upper_band=upper_band, lower_band=lower_band, trend=trend)
 
-    atr = TA.ATR(high, low, close, timeperiod=period)
 
-    upper_band = reference - (atr_multiplier * atr)
-    upper_band_list = [upper_band[0]]
-    num_upper_band_crosses = 0
+def _supertrend_loop(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    atr_multiplier: float,
+    reference: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes Wilder's ATR (same as `talib.ATR`), the bands and the trend in a single pass,
+    without materializing the intermediate ATR and band arrays.
+    The band extrema since the last trend change are tracked as running values.
+    """
+    length = len(high)
+    upper_band_out = np.full(length, np.nan)
+    lower_band_out = np.full(length, np.nan)
+    trend_out = np.ones(length, dtype=np.int64)
+    if length == 0:
+        return upper_band_out, lower_band_out, trend_out
 
-    lower_band = reference + (atr_multiplier * atr)
-    lower_band_list = [lower_band[0]]
-    num_lower_band_crosses = 0
+    atr = np.nan
+    tr_sum = 0.0
 
+    # running max of the upper bands (min of the lower bands) since the last trend change,
+    # starting from the first candle whose bands are undefined as the ATR is not available yet
+    upper_band_max = np.nan
+    lower_band_min = np.nan
     trend = 1
-    trend_list = [trend]
 
-    for i in range(1, len(high)):
+    for i in range(1, length):
+        prev_close = close[i - 1]
+        tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        if i < period:
+            tr_sum += tr
+        elif i == period:
+            atr = (tr_sum + tr) / period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+        mid = (high[i] + low[i]) * 0.5 if reference is None else reference[i]
+        upper_band = mid - atr_multiplier * atr
+        lower_band = mid + atr_multiplier * atr
+
         if trend == 1:
-            if close[i] > max(upper_band[num_upper_band_crosses:i]):
-                upper_band_list.append(max(upper_band[num_upper_band_crosses:i]))
-                lower_band_list.append(np.nan)
+            if close[i] > upper_band_max:
+                upper_band_out[i] = upper_band_max
+                if upper_band > upper_band_max:
+                    upper_band_max = upper_band
             else:
                 trend = -1
-                num_lower_band_crosses = i
-                upper_band_list.append(np.nan)
-                lower_band_list.append(lower_band[i])
+                lower_band_out[i] = lower_band
+                lower_band_min = lower_band
         else:
-            if close[i] < min(lower_band[num_lower_band_crosses:i]):
-                upper_band_list.append(np.nan)
-                lower_band_list.append(min(lower_band[num_lower_band_crosses:i]))
+            if close[i] < lower_band_min:
+                lower_band_out[i] = lower_band_min
+                if lower_band < lower_band_min:
+                    lower_band_min = lower_band
             else:
                 trend = 1
-                num_upper_band_crosses = i
-                upper_band_list.append(upper_band[i])
-                lower_band_list.append(np.nan)
-        trend_list.append(trend)
+                upper_band_out[i] = upper_band
+                upper_band_max = upper_band
+        trend_out[i] = trend
 
-    return SupertrendResult(
-        upper_band=np.array(upper_band_list),
-        lower_band=np.array(lower_band_list),
-        trend=np.array(trend_list),
-    )
+    return upper_band_out, lower_band_out, trend_out
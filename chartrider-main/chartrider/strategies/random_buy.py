@@ -1,6 +1,7 @@
 import random
 from datetime import datetime
 
+import numpy as np
 from loguru import logger
 
 from chartrider.core.common.repository.models import (
@@ -12,6 +13,8 @@ from chartrider.core.strategy.base import EventDrivenStrategy
 from chartrider.core.strategy.presets import StrategyPreset
 from chartrider.utils.symbols import Symbol
 
+RNG_BATCH_SIZE = 4096
+
 
 class RandomBuy(EventDrivenStrategy):
     def __init__(self, symbol: Symbol) -> None:
@@ -23,19 +26,27 @@ class RandomBuy(EventDrivenStrategy):
         return f"random{self.symbol.base_currency}"
 
     def setup(self) -> None:
-        pass
+        self._rng_buffer = np.random.random(RNG_BATCH_SIZE)
+        self._rng_index = 0
+
+    def _random(self) -> float:
+        """Same as `random.random()`, but draws the numbers in batches."""
+        if self._rng_index >= len(self._rng_buffer):
+            self._rng_buffer = np.random.random(RNG_BATCH_SIZE)
+            self._rng_index = 0
+        value = self._rng_buffer[self._rng_index]
+        self._rng_index += 1
+        return float(value)
 
     def update_indicators(self) -> None:
         pass
 
     def next(self):
-        current_price = self.get_last_price(self.symbol)
-
-        if random.random() < 0.99:
+        if self._random() < 0.99:
             # do nothing most of the time
             return
 
-        if random.random() < 0.9:
+        if self._random() < 0.9:
             orders = self.get_strategy_orders(self.symbol)
             if not orders:
                 return
@@ -51,8 +62,9 @@ class RandomBuy(EventDrivenStrategy):
 
             return
 
+        current_price = self.get_last_price(self.symbol)
         action = random.choice([OrderAction.open_long, OrderAction.open_short])
-        amount = (random.random() / 10) * (self.balance.totalWalletBalance / current_price)
+        amount = (self._random() / 10) * (self.balance.totalWalletBalance / current_price)
         price = current_price * random.choice([1.01, 0.99])  # may induce slippage
         contingent_sl = (
             ContingentOrder(triggerPrice=price * 0.9)
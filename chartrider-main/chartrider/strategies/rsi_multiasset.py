@@ -1,17 +1,23 @@
 from datetime import datetime
-from typing import cast
 
+import numpy as np
 import pandas as pd
 
 from chartrider.core.strategy.base import RebalancingStrategy
 from chartrider.core.strategy.presets import StrategyPreset
 from chartrider.utils.data import SymbolColumnData
 from chartrider.utils.symbols import Symbol
-from chartrider.utils.timeutils import TimeUtils
 
 N_CANDLES_PER_DAY = 24 * 60
 
 
+def _cs_rank(df: pd.DataFrame) -> pd.DataFrame:
+    """Cross-sectional percentile rank of each row, scaled to [0, 1] over its non-NaN values."""
+    ranks = df.rank(axis=1)
+    counts = df.notna().sum(axis=1)
+    return ranks.sub(1).div(counts.sub(1), axis=0)
+
+
 class RSIMultiAsset(RebalancingStrategy):
     def __init__(
         self,
@@ -42,12 +48,10 @@ class RSIMultiAsset(RebalancingStrategy):
         # hourly liquidity
         self.h_liq = self.make_indicator(self.calculate_liquidity(n_rolling=60), name="hourly_liq", plot=True)
 
-        # rank of the horuly liquidity
-        # FIXME: This is too ugly
-        _h_liq_df = self.h_liq.original_indicator.df()
-        h_liq_rank = _h_liq_df.apply(lambda x: (x.rank() - 1) / (len(x) - x.isna().sum() - 1), axis=1)
+        # rank of the hourly liquidity
+        h_liq_rank = _cs_rank(self.h_liq.original_indicator.df())
         self.h_liq_rank = self.make_indicator(
-            self.identity_indicator(df=cast(pd.DataFrame, h_liq_rank)), name="hourly_liq_rank", plot=True
+            self.identity_indicator(df=h_liq_rank), name="hourly_liq_rank", plot=True
         )
 
         _h_rsi_df = self.h_rsi.original_indicator.df()
@@ -59,38 +63,35 @@ class RSIMultiAsset(RebalancingStrategy):
         )
 
         # rank of the daily rsi
-        # FIXME: This is too ugly
-        _d_rsi_df = self.d_rsi.original_indicator.df()
-        d_rank = _d_rsi_df.apply(lambda x: (x.rank() - 1) / (len(x) - x.isna().sum() - 1), axis=1) ** self.rank_power
-        self.d_rank = self.make_indicator(
-            self.identity_indicator(df=cast(pd.DataFrame, d_rank)), name="daily_rsi_rank", plot=True
-        )
+        d_rank = _cs_rank(self.d_rsi.original_indicator.df()) ** self.rank_power
+        self.d_rank = self.make_indicator(self.identity_indicator(df=d_rank), name="daily_rsi_rank", plot=True)
 
     def next(self):
-        this_datetime = TimeUtils.timestamp_to_datetime(self.current_timestamp, truncate_to_minutes=True)
-
-        if this_datetime.minute != 0:
+        # rebalance only at the top of each hour
+        if (self.current_timestamp // 60_000) % 60 != 0:
             return
 
         d_rank = self.d_rank.resized_indicator.get_last()
+        sum_rank = d_rank.sum()
+        if not sum_rank > 0:
+            return
 
-        # Get the current position of this strategy
-        sum_rank = sum(d_rank)
-
-        current_prices = self.broker.candle_data.close.get_last()
+        current_prices = self.broker.candle_data.close.get_last(self.symbols)
 
         invest_amount = self.balance.totalWalletBalance * self.invest_ratio
-        new_positions = {
-            symbol: invest_amount / p * (r / sum_rank)
-            for symbol, r, p in zip(self.d_rank.resized_indicator.symbols, d_rank, current_prices)
-        }
+        amounts = (invest_amount / sum_rank) * d_rank / current_prices
+        new_positions = dict(zip(self.d_rank.resized_indicator.symbols, amounts.tolist()))
         self.rebalance(new_positions)
 
     def calculate_rsi(self, n_rolling: int) -> SymbolColumnData:
+        # Wilder's smoothing (RMA) of gains and losses
         close_diff = self.candle_data.close.df(self.symbols).diff(1)
-        gain = close_diff.where(close_diff > 0, 0).rolling(n_rolling).sum()
-        loss = -close_diff.where(close_diff < 0, 0).rolling(n_rolling).sum()
-        return SymbolColumnData.from_dataframe(gain / loss)
+        diff = close_diff.to_numpy()
+        gain = pd.DataFrame(np.maximum(diff, 0.0), index=close_diff.index, columns=close_diff.columns)
+        loss = pd.DataFrame(np.maximum(-diff, 0.0), index=close_diff.index, columns=close_diff.columns)
+        avg_gain = gain.ewm(alpha=1.0 / n_rolling, adjust=False, min_periods=n_rolling).mean()
+        avg_loss = loss.ewm(alpha=1.0 / n_rolling, adjust=False, min_periods=n_rolling).mean()
+        return SymbolColumnData.from_dataframe(100 - 100 / (1 + avg_gain / avg_loss))
 
     def calculate_liquidity(self, n_rolling: int) -> SymbolColumnData:
         volume = self.candle_data.volume.df(self.symbols).rolling(n_rolling).sum()
@@ -98,7 +99,8 @@ class RSIMultiAsset(RebalancingStrategy):
         return SymbolColumnData.from_dataframe(volume * close / n_rolling)
 
     def calculate_mask(self, h_rsi: pd.DataFrame, n_rolling: int, h_liq_rank: pd.DataFrame) -> SymbolColumnData:
-        h_rsi_zscore = (h_rsi - h_rsi.rolling(n_rolling).mean()) / h_rsi.rolling(n_rolling).std()
+        rolled = h_rsi.rolling(n_rolling)
+        h_rsi_zscore = (h_rsi - rolled.mean()) / rolled.std()
         h_rsi_mask = h_rsi_zscore > self.h_rsi_thres
         h_liq_mask = h_liq_rank > self.liq_thres
         return SymbolColumnData.from_dataframe(h_rsi_mask & h_liq_mask)
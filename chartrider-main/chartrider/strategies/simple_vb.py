@@ -11,7 +11,6 @@ from chartrider.core.strategy.base import EventDrivenStrategy
 from chartrider.core.strategy.presets import StrategyPreset
 from chartrider.utils.data import SymbolColumnData
 from chartrider.utils.symbols import Symbol
-from chartrider.utils.timeutils import TimeUtils
 
 N_CANDLES_PER_DAY = 24 * 60
 
@@ -38,7 +37,7 @@ class SimpleVB(EventDrivenStrategy):
         self.prev_range: float | None = None
         self.curr_range: float | None = None
         self.did_buy = False
-        self.live_minute = None
+        self.live_minute: int | None = None
 
     def update_indicators(self) -> None:
         self.sma12h = self.make_indicator(self.calculate_close_sma(n_candles=12 * 60))
@@ -49,7 +48,7 @@ class SimpleVB(EventDrivenStrategy):
 
     def next(self):
         current_timestamp = self.current_timestamp
-        this_minute = TimeUtils.timestamp_to_datetime(current_timestamp).minute
+        this_minute = (current_timestamp // 60_000) % 60
         if this_minute == self.live_minute:
             return
         else:
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
 from chartrider.core.common.repository.models import (
@@ -9,9 +11,9 @@ from chartrider.core.common.repository.models import (
 )
 from chartrider.core.strategy.base import EventDrivenStrategy
 from chartrider.core.strategy.presets import StrategyPreset
+from chartrider.indicators import RollingCache
 from chartrider.utils.data import SymbolColumnData
 from chartrider.utils.symbols import Symbol
-from chartrider.utils.timeutils import TimeUtils
 
 N_CANDLES_PER_DAY = 24 * 60
 
@@ -38,37 +40,74 @@ class SimpleVBsellonDeadCross(EventDrivenStrategy):
         self.prev_range: float | None = None
         self.curr_range: float | None = None
         self.did_buy = False
-        self.live_minute = None
+        self.rolling_cache = RollingCache()
+        self.live_minute: int | None = None
+        self.indicators_timestamp: int | None = None
 
     def update_indicators(self) -> None:
-        self.sma12h = self.make_indicator(self.calculate_close_sma(n_candles=12 * 60))
-        self.sma3 = self.make_indicator(self.calculate_close_sma(n_candles=3 * N_CANDLES_PER_DAY))
-        self.sma5 = self.make_indicator(self.calculate_close_sma(n_candles=5 * N_CANDLES_PER_DAY))
-        self.sma15 = self.make_indicator(self.calculate_close_sma(n_candles=15 * N_CANDLES_PER_DAY))
-        self.range = self.make_indicator(self.calculate_range(n_candles=N_CANDLES_PER_DAY))
+        # Nothing to do until a new candle arrives. Updates to the forming candle can be skipped,
+        # since `next` only acts on the first tick of each minute, right after the candle appeared.
+        timestamp = self.candle_data.timestamp_last
+        if timestamp == self.indicators_timestamp:
+            return
+        self.indicators_timestamp = timestamp
+
+        close = self.candle_data.close.df(self.symbols)
+        high = self.candle_data.high.df(self.symbols)
+        low = self.candle_data.low.df(self.symbols)
+
+        self.sma12h = self.make_indicator(self.calculate_close_sma(close, n_candles=12 * 60))
+        self.sma3 = self.make_indicator(self.calculate_close_sma(close, n_candles=3 * N_CANDLES_PER_DAY))
+        self.sma5 = self.make_indicator(self.calculate_close_sma(close, n_candles=5 * N_CANDLES_PER_DAY))
+        self.sma15 = self.make_indicator(self.calculate_close_sma(close, n_candles=15 * N_CANDLES_PER_DAY))
+        self.range = self.make_indicator(self.calculate_range(high, low, n_candles=N_CANDLES_PER_DAY))
+
+        # raw column arrays for `next`, indexed by the position of the current candle
+        sma12h = self.sma12h.original_indicator[self.symbol].as_array()
+        self._sma3_arr = self.sma3.original_indicator[self.symbol].as_array()
+        sma5 = self.sma5.original_indicator[self.symbol].as_array()
+        self._sma15_arr = self.sma15.original_indicator[self.symbol].as_array()
+        self._range_arr = self.range.original_indicator[self.symbol].as_array()
+
+        # The entry condition only depends on candle data, so evaluate it for every candle at once.
+        # The last price is the close of the current candle in both backtests and live trading.
+        close_arr = close[self.symbol].to_numpy()
+        self._entry_signal = np.logical_and.reduce(
+            [
+                close_arr >= sma12h + self._range_arr * self.k,
+                self._sma15_arr < close_arr,
+                sma5 < close_arr,
+                self._sma3_arr < close_arr,
+            ]
+        )
 
     def next(self):
         current_timestamp = self.current_timestamp
-        this_minute = TimeUtils.timestamp_to_datetime(current_timestamp).minute
+        this_minute = (current_timestamp // 60_000) % 60
         if this_minute == self.live_minute:
             return
         else:
             self.live_minute = this_minute
 
-        current_price = self.get_last_price(self.symbol)
-        base_price = self.sma12h[self.symbol][-1]
-        self.prev_range = self.range[self.symbol][-N_CANDLES_PER_DAY - 1] or None
-        self.curr_range = self.range[self.symbol][-1] or None
+        tick = len(self.range) - 1
+
+        # skip if the previous day's range is not available yet
+        if tick < N_CANDLES_PER_DAY:
+            return
+
+        self.prev_range = self._range_arr[tick - N_CANDLES_PER_DAY] or None
+        self.curr_range = self._range_arr[tick] or None
 
         # skip if we don't have enough data
-        if self.prev_range is None or self.curr_range is None or base_price is None:
+        if self.prev_range is None or self.curr_range is None:
             return
 
         if self.did_buy:
-            if self.sma3[self.symbol][-1] < self.sma15[self.symbol][-1]:  # Dead cross
+            if self._sma3_arr[tick] < self._sma15_arr[tick]:  # Dead cross
+                hold_cutoff = current_timestamp - self.holding_period * 60_000
                 for order in self.get_strategy_orders(self.symbol):
                     assert order.timestamp is not None  # FIXME: why is timestamp nullable?
-                    if order.timestamp < current_timestamp - self.holding_period * 60 * 1000:
+                    if order.timestamp < hold_cutoff:
                         order_status = self.sync_order_status(order)
 
                         if order_status == OrderStatus.closed:
@@ -83,14 +122,8 @@ class SimpleVBsellonDeadCross(EventDrivenStrategy):
                 self.did_buy = False
             return
 
-        hit_target_price = current_price >= base_price + self.curr_range * self.k
-
-        if (
-            hit_target_price
-            and self.sma15[self.symbol][-1] < current_price
-            and self.sma5[self.symbol][-1] < current_price
-            and self.sma3[self.symbol][-1] < current_price
-        ):
+        if self._entry_signal[tick]:
+            current_price = self.get_last_price(self.symbol)
             prev_volatility = self.prev_range / current_price
             invest_proportion = min(0.95, self.target_volatility / prev_volatility)
             balance = self.balance.totalWalletBalance / self.broker.registered_strategies_count
@@ -119,13 +152,13 @@ class SimpleVBsellonDeadCross(EventDrivenStrategy):
 
                 self.event_monitor.did_liquidate_by_contingent.subscribe(order.id, reset_did_buy_on_sltp)
 
-    def calculate_close_sma(self, n_candles: int) -> SymbolColumnData:
-        sma_df = self.candle_data.close.df(self.symbols).rolling(n_candles).mean()
+    def calculate_close_sma(self, close: pd.DataFrame, n_candles: int) -> SymbolColumnData:
+        sma_df = self.rolling_cache.mean("close", close, n_candles)
         return SymbolColumnData.from_dataframe(sma_df)
 
-    def calculate_range(self, n_candles: int) -> SymbolColumnData:
-        high_max = self.candle_data.high.df(self.symbols).rolling(n_candles).max()
-        low_min = self.candle_data.low.df(self.symbols).rolling(n_candles).min()
+    def calculate_range(self, high: pd.DataFrame, low: pd.DataFrame, n_candles: int) -> SymbolColumnData:
+        high_max = self.rolling_cache.max("high", high, n_candles)
+        low_min = self.rolling_cache.min("low", low, n_candles)
         return SymbolColumnData.from_dataframe((high_max - low_min).round(decimals=6))
 
 
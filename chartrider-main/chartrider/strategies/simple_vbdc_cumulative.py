@@ -1,5 +1,8 @@
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from chartrider.core.common.repository.models import (
     ContingentOrder,
     OrderAction,
@@ -7,9 +10,9 @@ from chartrider.core.common.repository.models import (
 )
 from chartrider.core.strategy.base import EventDrivenStrategy
 from chartrider.core.strategy.presets import StrategyPreset
+from chartrider.indicators import RollingCache
 from chartrider.utils.data import SymbolColumnData
 from chartrider.utils.symbols import Symbol
-from chartrider.utils.timeutils import TimeUtils
 
 N_CANDLES_PER_DAY = 24 * 60
 
@@ -39,73 +42,102 @@ class SimpleVBDCCumulative(EventDrivenStrategy):
     def setup(self) -> None:
         self.curr_range: float | None = None
         self.did_buy = False
+        self.rolling_cache = RollingCache()
         self.ready_to_buy = True
         self.broker.repository.set_leverage(self.symbol, self.leverage)
-        self.last_executed_minute = None
+        self.last_executed_minute: int | None = None
+        self.indicators_timestamp: int | None = None
 
     def update_indicators(self) -> None:
+        # Nothing to do until a new candle arrives. Updates to the forming candle can be skipped,
+        # since `next` only acts on the first tick of each minute, right after the candle appeared.
+        timestamp = self.candle_data.timestamp_last
+        if timestamp == self.indicators_timestamp:
+            return
+        self.indicators_timestamp = timestamp
+
+        close = self.candle_data.close.df(self.symbols)
+        high = self.candle_data.high.df(self.symbols)
+        low = self.candle_data.low.df(self.symbols)
+
         base_dur = N_CANDLES_PER_DAY // 24 * 30  # 30 hours
 
-        self.sma_1 = self.make_indicator(self.calculate_close_sma(n_candles=base_dur // 2))
-        self.sma_2 = self.make_indicator(self.calculate_close_sma(n_candles=base_dur * 3))
-        self.sma_3 = self.make_indicator(self.calculate_close_sma(n_candles=base_dur * 5))
-        self.sma_4 = self.make_indicator(self.calculate_close_sma(n_candles=base_dur * 15))
-        self.range = self.make_indicator(self.calculate_range(n_candles=base_dur))
+        self.sma_1 = self.make_indicator(self.calculate_close_sma(close, n_candles=base_dur // 2))
+        self.sma_2 = self.make_indicator(self.calculate_close_sma(close, n_candles=base_dur * 3))
+        self.sma_3 = self.make_indicator(self.calculate_close_sma(close, n_candles=base_dur * 5))
+        self.sma_4 = self.make_indicator(self.calculate_close_sma(close, n_candles=base_dur * 15))
+        self.range = self.make_indicator(self.calculate_range(high, low, n_candles=base_dur))
+
+        # raw column arrays for `next`, indexed by the position of the current candle
+        self._sma_1_arr = self.sma_1.original_indicator[self.symbol].as_array()
+        sma_2 = self.sma_2.original_indicator[self.symbol].as_array()
+        self._sma_3_arr = self.sma_3.original_indicator[self.symbol].as_array()
+        sma_4 = self.sma_4.original_indicator[self.symbol].as_array()
+        self._range_arr = self.range.original_indicator[self.symbol].as_array()
+
+        # The entry condition only depends on candle data, so evaluate it for every candle at once.
+        # The last price is the close of the current candle in both backtests and live trading.
+        close_arr = close[self.symbol].to_numpy()
+        self._entry_signal = np.logical_and.reduce(
+            [
+                close_arr >= self._sma_1_arr + self._range_arr * self.k,
+                sma_4 < close_arr,
+                self._sma_3_arr < close_arr,
+                sma_2 < close_arr,
+                sma_4 < sma_2,
+            ]
+        )
 
     def next(self):
         current_timestamp = self.current_timestamp
-        this_minute = TimeUtils.timestamp_to_datetime(current_timestamp).minute
+        this_minute = (current_timestamp // 60_000) % 60
         if this_minute == self.last_executed_minute:
             return
         else:
             self.last_executed_minute = this_minute
 
-        current_price = self.get_last_price(self.symbol)
-        base_price = self.sma_1[self.symbol][-1]
-        self.curr_range = self.range[self.symbol][-1] or None
+        tick = len(self.range) - 1
+        self.curr_range = self._range_arr[tick] or None
 
         # skip if we don't have enough data
-        if self.curr_range is None or base_price is None:
+        if self.curr_range is None:
             return
 
+        orders = self.strategy_orders[self.symbol]
+
         if self.did_buy:
             self.ready_to_buy = True
-            for order in self.get_strategy_orders(self.symbol):
+            is_dead_cross = self._sma_1_arr[tick] < self._sma_3_arr[tick]
+            hold_cutoff = current_timestamp - self.holding_period * 60_000
+            buy_cutoff = current_timestamp - self.buy_interval * 60_000
+            for order in tuple(orders):
                 assert order.timestamp is not None  # FIXME: why is timestamp nullable?
-                if order.timestamp < current_timestamp - self.holding_period * 60 * 1000:
-                    if self.sma_1[self.symbol][-1] < self.sma_3[self.symbol][-1]:  # Dead cross
-                        order_status = self.sync_order_status(order)
-
-                        if order_status == OrderStatus.closed:
-                            self.liquidate_order(order)
-                            continue
-
-                        if order_status == OrderStatus.open:
-                            self.cancel_order(order)
-                            continue
-                if order.timestamp > current_timestamp - self.buy_interval * 60 * 1000:
+                if is_dead_cross and order.timestamp < hold_cutoff:
+                    order_status = self.sync_order_status(order, bucket=orders)
+
+                    if order_status == OrderStatus.closed:
+                        self.liquidate_order(order)
+                        continue
+
+                    if order_status == OrderStatus.open:
+                        self.cancel_order(order, bucket=orders)
+                        continue
+                if order.timestamp > buy_cutoff:
                     # If it is within the `buy_interval` since the last order was created,
                     # we're not ready to buy more.
                     self.ready_to_buy = False
 
-            if len(self.strategy_orders[self.symbol]) == 0:
+            if not orders:
                 self.did_buy = False
 
             if not self.ready_to_buy:
                 return
 
-        hit_target_price = current_price >= base_price + self.curr_range * self.k
-
-        if (
-            hit_target_price
-            and self.sma_4[self.symbol][-1] < current_price
-            and self.sma_3[self.symbol][-1] < current_price
-            and self.sma_2[self.symbol][-1] < current_price
-            and self.sma_4[self.symbol][-1] < self.sma_2[self.symbol][-1]
-        ):
+        if self._entry_signal[tick]:
+            current_price = self.get_last_price(self.symbol)
             balance = self.balance.totalWalletBalance / self.broker.registered_strategies_count
             # TODO: use CLV to determine the amount to buy
-            invest_proportion = self.max_invest_proportion * max(0.4, (0.8 ** len(self.strategy_orders[self.symbol])))
+            invest_proportion = self.max_invest_proportion * max(0.4, (0.8 ** len(orders)))
             notional = min(invest_proportion * balance, self.balance.availableBalance) * self.leverage
             notional *= 0.99  # consider fees and slippage
             amount = notional / current_price
@@ -128,13 +160,13 @@ class SimpleVBDCCumulative(EventDrivenStrategy):
                 )
                 self.did_buy = True
 
-    def calculate_close_sma(self, n_candles: int) -> SymbolColumnData:
-        sma_df = self.candle_data.close.df(self.symbols).rolling(n_candles).mean()
+    def calculate_close_sma(self, close: pd.DataFrame, n_candles: int) -> SymbolColumnData:
+        sma_df = self.rolling_cache.mean("close", close, n_candles)
         return SymbolColumnData.from_dataframe(sma_df)
 
-    def calculate_range(self, n_candles: int) -> SymbolColumnData:
-        high_max = self.candle_data.high.df(self.symbols).rolling(n_candles).max()
-        low_min = self.candle_data.low.df(self.symbols).rolling(n_candles).min()
+    def calculate_range(self, high: pd.DataFrame, low: pd.DataFrame, n_candles: int) -> SymbolColumnData:
+        high_max = self.rolling_cache.max("high", high, n_candles)
+        low_min = self.rolling_cache.min("low", low, n_candles)
         return SymbolColumnData.from_dataframe((high_max - low_min).round(decimals=6))
 
 
@@ -1,11 +1,14 @@
 from datetime import datetime
 from textwrap import dedent
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 
+from chartrider.core.common.broker.base import BaseBroker
 from chartrider.core.common.repository.models import ContingentOrder, OrderAction
 from chartrider.core.strategy.base import EventDrivenStrategy
 from chartrider.core.strategy.presets import StrategyPreset
+from chartrider.indicators import RollingCache
 from chartrider.utils.data import SymbolColumnData
 from chartrider.utils.symbols import Symbol
 from chartrider.utils.timeutils import TimeUtils
@@ -14,6 +17,10 @@ N_CANDLES_PER_DAY = 24 * 60
 
 
 class VolatilityBreakout(EventDrivenStrategy):
+    # shared by the instances of one run, as the presets run one instance per reference hour on the same candles;
+    # keyed weakly by the broker, so that a cache is dropped along with its run and never outlives it
+    __rolling_caches: "WeakKeyDictionary[BaseBroker, RollingCache]" = WeakKeyDictionary()
+
     def __init__(
         self,
         symbol: Symbol,
@@ -31,6 +38,13 @@ class VolatilityBreakout(EventDrivenStrategy):
     def slug(self) -> str:
         return f"vb{self.reference_hour}{self.symbol}"
 
+    @property
+    def rolling_cache(self) -> RollingCache:
+        rolling_cache = self.__rolling_caches.get(self.broker)
+        if rolling_cache is None:
+            rolling_cache = self.__rolling_caches[self.broker] = RollingCache()
+        return rolling_cache
+
     def setup(self) -> None:
         self.prev_range: float | None = None
         self.curr_range: float | None = None
@@ -87,14 +101,16 @@ class VolatilityBreakout(EventDrivenStrategy):
         if self.did_buy:
             return
 
-        hit_target_price = current_price >= self.starting_price + self.curr_range * self.k
+        target_price = self.starting_price + self.curr_range * self.k
+        hit_target_price = current_price >= target_price
+        if not hit_target_price:
+            return
 
-        if (
-            hit_target_price
-            and self.sma15[self.symbol][-1] < current_price
-            and self.sma5[self.symbol][-1] < current_price
-            and self.sma3[self.symbol][-1] < current_price
-        ):
+        sma3 = self.sma3[self.symbol][-1]
+        sma5 = self.sma5[self.symbol][-1]
+        sma15 = self.sma15[self.symbol][-1]
+
+        if sma15 < current_price and sma5 < current_price and sma3 < current_price:
             prev_volatility = self.prev_range / current_price
             invest_proportion = min(0.99, (self.target_volatility / prev_volatility))
             balance = self.balance.totalWalletBalance / self.broker.registered_strategies_count
@@ -122,40 +138,42 @@ class VolatilityBreakout(EventDrivenStrategy):
                     Reference hour: {self.reference_hour}
                     Datetime: {this_datetime}
                     Current price: {current_price}
-                    Target price: {self.starting_price + self.curr_range * self.k}
-                    SMA3: {self.sma3[self.symbol][-1]}
-                    SMA5: {self.sma5[self.symbol][-1]}
-                    SMA10: {self.sma15[self.symbol][-1]}
+                    Target price: {target_price}
+                    SMA3: {sma3}
+                    SMA5: {sma5}
+                    SMA10: {sma15}
                     Invest proportion: {invest_proportion}
                     </pre>
                     """
                 )
             )
-        elif hit_target_price:
-            logger.debug(
-                dedent(
+        else:
+            # this can happen on every candle, so only build the message if debug logs are emitted
+            logger.opt(lazy=True).debug(
+                "{}",
+                lambda: dedent(
                     f"""
                     Target price hit but SMA conditions not met.
                     <pre>
                     Reference hour: {self.reference_hour}
                     Datetime: {this_datetime}
                     Current price: {current_price}
-                    Target price: {self.starting_price + self.curr_range * self.k}
-                    SMA3: {self.sma3[self.symbol][-1]}
-                    SMA5: {self.sma5[self.symbol][-1]}
-                    SMA10: {self.sma15[self.symbol][-1]}
+                    Target price: {target_price}
+                    SMA3: {sma3}
+                    SMA5: {sma5}
+                    SMA10: {sma15}
                     </pre>
                     """
-                )
+                ),
             )
 
     def calculate_close_sma(self, n_candles: int) -> SymbolColumnData:
-        sma_df = self.candle_data.close.df(self.symbols).rolling(n_candles).mean()
+        sma_df = self.rolling_cache.mean(("close", self.symbol), self.candle_data.close.df(self.symbols), n_candles)
         return SymbolColumnData.from_dataframe(sma_df)
 
     def calculate_range(self, n_candles: int) -> SymbolColumnData:
-        high_max = self.candle_data.high.df(self.symbols).rolling(n_candles).max()
-        low_min = self.candle_data.low.df(self.symbols).rolling(n_candles).min()
+        high_max = self.rolling_cache.max(("high", self.symbol), self.candle_data.high.df(self.symbols), n_candles)
+        low_min = self.rolling_cache.min(("low", self.symbol), self.candle_data.low.df(self.symbols), n_candles)
         return SymbolColumnData.from_dataframe((high_max - low_min).round(decimals=6))
 
 
@@ -3,41 +3,47 @@ import os
 from loguru import logger
 from telegram.ext import Application, PicklePersistence
 
+from chartrider.core.live.io.message import close_shared_connection
 from chartrider.settings import DB_PATH
 from chartrider.settings import telegram_settings as settings
 from chartrider.telegram import handlers
 from chartrider.telegram.context import TelegramUserContext
 from chartrider.telegram.utils import (
     Emoji,
-    TaskHandler,
+    close_rpc_client,
+    get_rpc_client,
+    get_task_handler,
     start_handling_incoming_message,
 )
-from chartrider.worker.rpc import RpcWorkerClient
 
 
-async def restart_user(user_id: int, app: Application, user_context: TelegramUserContext):
+async def restart_user(
+    user_id: int, app: Application, user_context: TelegramUserContext, containers_running: dict[str, bool]
+):
     if app.job_queue is None:
         logger.warning("Job queue is not initialized.")
         return
-    async with RpcWorkerClient() as rpc:
-        for testnet, container_id in list(user_context.container_ids.items()):
-            if not (await rpc.container_exists(container_id)):
-                await app.bot.send_message(
-                    user_id,
-                    (
-                        f"{Emoji.announce} It looks like the container {container_id[:7]} is dead now (testnet:"
-                        f" {testnet})."
-                    ),
-                )
-                user_context.container_ids.pop(testnet)
-            else:
-                await start_handling_incoming_message(app.job_queue, user_id, testnet, container_id)
-                logger.debug(f"Restarted message broker for {user_id=} {container_id=} (testnet: {testnet}).")
-        try:
-            app.user_data[user_id]["context"] = user_context
-        except KeyError:
-            logger.debug(f"User {user_id} has no context. {app.user_data=}")
-            pass
+    for testnet, container_id in list(user_context.container_ids.items()):
+        if (running := containers_running.get(container_id)) is None:
+            # the worker could not check it; keep it rather than drop a trader that may still be alive
+            logger.warning(f"Could not check whether {container_id=} is running (testnet: {testnet}).")
+        if running is False:
+            await app.bot.send_message(
+                user_id,
+                (
+                    f"{Emoji.announce} It looks like the container {container_id[:7]} is dead now (testnet:"
+                    f" {testnet})."
+                ),
+            )
+            user_context.container_ids.pop(testnet)
+        else:
+            await start_handling_incoming_message(app.job_queue, user_id, testnet, container_id)
+            logger.debug(f"Restarted message broker for {user_id=} {container_id=} (testnet: {testnet}).")
+    try:
+        app.user_data[user_id]["context"] = user_context
+    except KeyError:
+        logger.debug(f"User {user_id} has no context. {app.user_data=}")
+        pass
 
 
 async def register_command_handlers(app: Application) -> None:
@@ -46,21 +52,36 @@ async def register_command_handlers(app: Application) -> None:
 
 async def post_init(app: Application) -> None:
     await register_command_handlers(app)
+    user_contexts: dict[int, TelegramUserContext] = {}
     for user_id, user_data in app.user_data.items():
         if (user_context := user_data.get("context")) is None or not TelegramUserContext.is_compatible(user_context):
             continue
+        user_contexts[user_id] = user_context
+
+    # check every user's containers in a single round-trip to the worker
+    container_ids = [
+        container_id for user_context in user_contexts.values() for container_id in user_context.container_ids.values()
+    ]
+    containers_running = await (await get_rpc_client()).containers_running(container_ids)
+
+    for user_id, user_context in user_contexts.items():
         await app.bot.send_message(user_id, f"{Emoji.announce} The bot has been restarted (pid: {os.getpid()}).")
-        await restart_user(user_id, app, user_context)
+        await restart_user(user_id, app, user_context, containers_running)
     logger.info("The bot has been started.")
 
 
 async def post_stop(app: Application) -> None:
-    await TaskHandler().cancel_tasks()
+    await get_task_handler().cancel_tasks()
     for user_id in app.user_data.keys():
         await app.bot.send_message(user_id, f"{Emoji.announce} The bot has been stopped for maintenance.")
     logger.info("The bot has been stopped.")
 
 
+async def post_shutdown(app: Application) -> None:
+    await close_rpc_client()
+    await close_shared_connection()
+
+
 def create_app() -> Application:
     app = (
         Application.builder()
@@ -72,6 +93,7 @@ def create_app() -> Application:
         .pool_timeout(60)
         .post_init(post_init)
         .post_stop(post_stop)
+        .post_shutdown(post_shutdown)
         .build()
     )
     for command_handler in handlers.command_handlers:
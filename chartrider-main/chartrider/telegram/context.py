@@ -102,14 +102,15 @@ class TelegramUserContext(BaseModel):
     def is_compatible(cls, other_context: BaseModel) -> bool:
         if not isinstance(other_context, TelegramUserContext):
             return False
-        return cls.model_fields.keys() == other_context.model_fields.keys()
+        # instances of this very class share its fields, so only other subclasses need the comparison
+        return type(other_context) is cls or cls.model_fields.keys() == other_context.model_fields.keys()
 
 
 def get_user_context(context: ContextTypes.DEFAULT_TYPE) -> TelegramUserContext:
     assert context.user_data is not None
-    user_context = context.user_data.setdefault("context", TelegramUserContext())
-    assert isinstance(user_context, TelegramUserContext)
-    if not TelegramUserContext.is_compatible(user_context):
+    # `setdefault` would build (and validate) a throwaway model on every lookup
+    user_context = context.user_data.get("context")
+    if user_context is None or not TelegramUserContext.is_compatible(user_context):
         new_context = TelegramUserContext()
         context.user_data["context"] = new_context
         return new_context
@@ -8,10 +8,12 @@ from .io import input_handler
 from .register import register_secret_handler
 from .run import run_handler
 
-bot_commands = [command_handler_wrapper.as_bot_command for command_handler_wrapper in __command_handler_wrappers]
-bot_commands += [__BotCommand("switch", "Switch between testnet and mainnet.")]
-bot_commands += [__BotCommand("register", "Register a new secret.")]
-bot_commands += [__BotCommand("run", "Run the live trading system.")]
+bot_commands: tuple[__BotCommand, ...] = (
+    *(command_handler_wrapper.as_bot_command for command_handler_wrapper in __command_handler_wrappers),
+    __BotCommand("switch", "Switch between testnet and mainnet."),
+    __BotCommand("register", "Register a new secret."),
+    __BotCommand("run", "Run the live trading system."),
+)
 
 
 __all__ = [
@@ -11,8 +11,7 @@ from chartrider.core.live.io.message import (
     QueueType,
 )
 from chartrider.telegram.context import get_user_context
-from chartrider.telegram.utils import Emoji
-from chartrider.worker.rpc import RpcWorkerClient
+from chartrider.telegram.utils import Emoji, get_rpc_client
 
 
 def create_command_handler(command: CommandType):
@@ -43,10 +42,10 @@ async def force_kill(update: Update, context: ContextTypes.DEFAULT_TYPE):
     assert update.message is not None
     user_context = get_user_context(context)
 
-    async with RpcWorkerClient() as rpc:
-        if user_context.container_id is not None and await rpc.kill_container(user_context.container_id):
-            await update.message.reply_text(f"{Emoji.conversation} Killed container {user_context.container_id[:7]}.")
-            return
+    rpc = await get_rpc_client()
+    if user_context.container_id is not None and await rpc.kill_container(user_context.container_id):
+        await update.message.reply_text(f"{Emoji.conversation} Killed container {user_context.container_id[:7]}.")
+        return
 
     await update.message.reply_text(f"{Emoji.conversation} You don't have a running container.")
     user_context.set_container_id(None)
@@ -57,12 +56,12 @@ async def is_container_running(update: Update, context: ContextTypes.DEFAULT_TYP
     assert update.message is not None
     user_context = get_user_context(context)
 
-    async with RpcWorkerClient() as rpc:
-        if user_context.container_id is None or not await rpc.container_exists(user_context.container_id):
-            await update.message.reply_text("You don't have a running container.")
-            user_context.set_container_id(None)
-            user_context.save(context)
-            return
+    rpc = await get_rpc_client()
+    if user_context.container_id is None or not await rpc.container_exists(user_context.container_id):
+        await update.message.reply_text("You don't have a running container.")
+        user_context.set_container_id(None)
+        user_context.save(context)
+        return
 
     await update.message.reply_text(
         f"{Emoji.conversation} Your instance is running on container {user_context.container_id[:7]}.\n"
@@ -95,13 +94,13 @@ class CommandHandlerWrapper:
         return CommandHandler(self.command, self.handler)
 
 
-command_handler_wrappers = [
-    CommandHandlerWrapper(command.name, command.description, create_command_handler(command))
-    for command in CommandType
-]
-command_handler_wrappers += [CommandHandlerWrapper("kill", "Forcibly kill current running container.", force_kill)]
-command_handler_wrappers += [CommandHandlerWrapper("context", "Show current context.", my_context)]
-command_handler_wrappers += [
-    CommandHandlerWrapper("is_running", "Check if there's running container.", is_container_running)
-]
-command_handlers = [handler.as_cmd_handler for handler in command_handler_wrappers]
+command_handler_wrappers: tuple[CommandHandlerWrapper, ...] = (
+    *(
+        CommandHandlerWrapper(command.name, command.description, create_command_handler(command))
+        for command in CommandType
+    ),
+    CommandHandlerWrapper("kill", "Forcibly kill current running container.", force_kill),
+    CommandHandlerWrapper("context", "Show current context.", my_context),
+    CommandHandlerWrapper("is_running", "Check if there's running container.", is_container_running),
+)
+command_handlers: tuple[CommandHandler, ...] = tuple(handler.as_cmd_handler for handler in command_handler_wrappers)
@@ -7,6 +7,10 @@ from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import CallbackContext
 
+MAX_UPDATE_LENGTH = 4096
+MAX_CONTEXT_DATA_LENGTH = 2048
+MAX_TRACEBACK_LENGTH = 4096
+
 
 async def error_handler(update: Update | None, context: CallbackContext):
     if update is None:
@@ -14,18 +18,23 @@ async def error_handler(update: Update | None, context: CallbackContext):
         return
     assert context.error is not None and update.message is not None
     tb_list = traceback.format_exception(None, context.error, context.error.__traceback__)
-    tb_string = "".join(tb_list)
+    tb_string = "".join(tb_list)[-MAX_TRACEBACK_LENGTH:]
 
+    # cap each part before escaping, so that huge updates or user data keep the message bounded
     update_str = update.to_dict() if isinstance(update, Update) else str(update)
+    update_json = json.dumps(update_str, indent=2, ensure_ascii=False)[:MAX_UPDATE_LENGTH]
+    chat_data = str(context.chat_data)[:MAX_CONTEXT_DATA_LENGTH]
+    user_data = str(context.user_data)[:MAX_CONTEXT_DATA_LENGTH]
     message = (
         "An exception was raised while handling an update.\n\n"
-        f"<pre>update = {html.escape(json.dumps(update_str, indent=2, ensure_ascii=False))}"
+        f"<pre>update = {html.escape(update_json)}"
         "</pre>\n\n"
-        f"<pre>context.chat_data = {html.escape(str(context.chat_data))}</pre>\n\n"
-        f"<pre>context.user_data = {html.escape(str(context.user_data))}</pre>\n\n"
+        f"<pre>context.chat_data = {html.escape(chat_data)}</pre>\n\n"
+        f"<pre>context.user_data = {html.escape(user_data)}</pre>\n\n"
         f"<pre>{html.escape(tb_string)}</pre>"
     )
 
+    # safety net, in case escaping blew up the capped parts
     if len(message) > 8192:
         message = message[:4096] + "..." + message[-4096:]
 
@@ -16,10 +16,10 @@ from chartrider.telegram.context import get_user_context
 from chartrider.telegram.utils import (
     Emoji,
     fallback_func,
+    get_rpc_client,
     make_keyboard_array,
     start_handling_incoming_message,
 )
-from chartrider.worker.rpc import RpcWorkerClient
 
 
 class State(Enum):
@@ -30,6 +30,24 @@ class State(Enum):
 
 NextState: TypeAlias = State | int
 
+# strategy presets are fixed at import time, so the /run prompt only needs to be built once
+_presets_choices = "".join(
+    f"""
+    <u>{i}. {preset.name}</u>
+    <i>{preset.description}</i>
+    """
+    for i, preset in enumerate(strategy_presets, 1)
+)
+CHOOSE_PRESET_MESSAGE = dedent(
+    f"""
+    {Emoji.conversation} Please choose a strategy preset.
+    {_presets_choices}
+    """
+)
+CHOOSE_PRESET_KEYBOARD = ReplyKeyboardMarkup(
+    make_keyboard_array(str(i) for i in range(1, len(strategy_presets) + 1)), one_time_keyboard=True
+)
+
 
 async def run(update: Update, context: ContextTypes.DEFAULT_TYPE) -> NextState:
     assert update.message is not None
@@ -56,34 +74,15 @@ async def run(update: Update, context: ContextTypes.DEFAULT_TYPE) -> NextState:
         return ConversationHandler.END
 
     if container_id := user_context.container_id:
-        async with RpcWorkerClient() as rpc_client:
-            if await rpc_client.container_exists(container_id):
-                await update.message.reply_text(
-                    "You already have a running container. Please /stop or /kill it first."
-                )
-                return ConversationHandler.END
-            else:
-                user_context.set_container_id(None)
-                user_context.save(context)
-
-    presets_choices = "".join(
-        f"""
-    <u>{i}. {preset.name}</u>
-    <i>{preset.description}</i>
-    """
-        for i, preset in enumerate(strategy_presets, 1)
-    )
+        rpc_client = await get_rpc_client()
+        if await rpc_client.container_exists(container_id):
+            await update.message.reply_text("You already have a running container. Please /stop or /kill it first.")
+            return ConversationHandler.END
+        else:
+            user_context.set_container_id(None)
+            user_context.save(context)
 
-    html_message = f"""
-    {Emoji.conversation} Please choose a strategy preset.
-    {presets_choices}
-    """
-    await update.message.reply_html(
-        dedent(html_message),
-        reply_markup=ReplyKeyboardMarkup(
-            make_keyboard_array(str(i) for i in range(1, len(strategy_presets) + 1)), one_time_keyboard=True
-        ),
-    )
+    await update.message.reply_html(CHOOSE_PRESET_MESSAGE, reply_markup=CHOOSE_PRESET_KEYBOARD)
 
     return State.choose_strategy_preset
 
@@ -92,15 +91,15 @@ async def choose_strategy_preset(update: Update, context: ContextTypes.DEFAULT_T
     assert update.message is not None
     assert context.user_data is not None
 
-    try:
-        chosen_preset_index = int(str(update.message.text)) - 1
-        chosen_preset = strategy_presets[chosen_preset_index]
-    except (ValueError, IndexError, TypeError, AttributeError):
+    text = update.message.text
+    chosen_preset_index = int(text) - 1 if text is not None and text.isdecimal() else -1
+    if not 0 <= chosen_preset_index < len(strategy_presets):
         await update.message.reply_html(
             r"Invalid preset index. Please choose a valid preset index.",
             reply_markup=ForceReply(selective=True),
         )
         return State.choose_strategy_preset
+    chosen_preset = strategy_presets[chosen_preset_index]
 
     user_context = get_user_context(context)
     user_context.strategy_preset = chosen_preset
@@ -130,10 +129,10 @@ async def confirm_run(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Nex
     user_context = get_user_context(context)
     assert user_context.testnet is not None
 
-    async with RpcWorkerClient() as rpc:
-        container_id = await rpc.create_isolated_container(user_context)
-        user_context.set_container_id(container_id)
-        user_context.save(context)
+    rpc = await get_rpc_client()
+    container_id = await rpc.create_isolated_container(user_context)
+    user_context.set_container_id(container_id)
+    user_context.save(context)
 
     await start_handling_incoming_message(
         context.job_queue, update.effective_user.id, user_context.testnet, container_id
@@ -20,10 +20,13 @@ def main() -> None:
     logger.info("Waiting for 5 seconds for RabbitMQ...")
     time.sleep(5)
     logger.info("Starting the bot...")
+    # Long polling: `getUpdates` is held open by Telegram until an update arrives or `timeout` passes,
+    # kept at 50 seconds, as Telegram is known to cut longer polls short. PTB extends the read timeout by `timeout`.
     app.run_polling(
         close_loop=False,
         drop_pending_updates=True,
-        timeout=60,
+        poll_interval=0.0,
+        timeout=50,
         bootstrap_retries=5,
     )
 
@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+from functools import lru_cache
 from typing import Any, Coroutine, Iterable
 
 from loguru import logger
@@ -9,37 +10,58 @@ from telegram.ext import CallbackContext, ContextTypes, ConversationHandler, Job
 
 from chartrider.core.live.io.message import MessageBroker, MessageItem, QueueType
 from chartrider.telegram.context import get_user_context
+from chartrider.worker.rpc import RpcWorkerClient
 
 
-class SingletonMeta(type):
-    _instances = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
-
-
-class TaskHandler(metaclass=SingletonMeta):
+class TaskHandler:
     def __init__(self):
-        self.tasks = []
+        self.tasks: set[asyncio.Task] = set()
 
     async def add_task(self, task: Coroutine[Any, Any, None]):
-        self.tasks.append(asyncio.create_task(task))
+        # finished tasks drop out of the set, so it only ever holds the running ones
+        created_task = asyncio.create_task(task)
+        self.tasks.add(created_task)
+        created_task.add_done_callback(self.tasks.discard)
 
     async def cancel_tasks(self):
-        for task in self.tasks:
+        for task in list(self.tasks):
             task.cancel()
 
 
-def make_keyboard_array(arr: Iterable[str]) -> list[list[str]]:
-    column = 2
+_task_handler: TaskHandler | None = None
+
+
+def get_task_handler() -> TaskHandler:
+    global _task_handler
+    if _task_handler is None:
+        _task_handler = TaskHandler()
+    return _task_handler
+
+
+_rpc_client: RpcWorkerClient | None = None
+_rpc_client_lock = asyncio.Lock()
+
+
+async def get_rpc_client() -> RpcWorkerClient:
+    """Returns the RPC client shared by all handlers, connecting it on first use."""
+    global _rpc_client
+    async with _rpc_client_lock:
+        if _rpc_client is None:
+            _rpc_client = await RpcWorkerClient().__aenter__()
+        return _rpc_client
+
+
+async def close_rpc_client() -> None:
+    global _rpc_client
+    async with _rpc_client_lock:
+        if _rpc_client is not None:
+            await _rpc_client.__aexit__(None, None, None)
+            _rpc_client = None
+
+
+def make_keyboard_array(arr: Iterable[str], column: int = 2) -> list[list[str]]:
     str_arr = list(map(str, arr))
-    nested_array = []
-    for i in range(0, len(str_arr), column):
-        nested_array.append(str_arr[i : i + column])
-    return nested_array
+    return [str_arr[i : i + column] for i in range(0, len(str_arr), column)]
 
 
 async def start_handling_incoming_message(job_queue: JobQueue, user_id: int, testnet: bool, container_id: str) -> None:
@@ -104,7 +126,7 @@ async def handle_incoming_message(context: CallbackContext) -> None:
         )
 
         # Don't await the infinite task in the job queue.
-        await TaskHandler().add_task(message_broker.consume_and_wait(QueueType.telegram, callback))
+        await get_task_handler().add_task(message_broker.consume_and_wait(QueueType.telegram, callback))
     except Exception as e:
         logger.exception(e)
         if context.job is not None and (user_id := context.job.user_id) is not None:
@@ -114,8 +136,9 @@ async def handle_incoming_message(context: CallbackContext) -> None:
             )
 
 
+@lru_cache(maxsize=4096)
 def get_job_name(user_id: int, testnet: bool) -> str:
-    return hashlib.md5(f"handle_incoming_message-{user_id}-{testnet}".encode()).hexdigest()
+    return hashlib.blake2b(f"handle_incoming_message-{user_id}-{testnet}".encode(), digest_size=16).hexdigest()
 
 
 def fallback_func(command: str):
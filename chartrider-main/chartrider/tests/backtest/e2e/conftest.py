@@ -1,10 +1,8 @@
 from pathlib import Path
-from typing import Any, Callable, Coroutine, Dict, List
-from unittest.mock import MagicMock
+from typing import Any, Coroutine, Dict, List, NamedTuple
 
 import numpy as np
 import pytest
-from pydantic import BaseModel
 from pytest_mock import MockerFixture
 
 from chartrider.core.backtest.broker import BacktestBroker
@@ -13,6 +11,7 @@ from chartrider.core.common.repository.candle.repository import BaseCandleReposi
 from chartrider.core.common.repository.contingent.repository import (
     ContingentInfoBaseRepository,
     ContingentInfoDBRepository,
+    ContingentInfoInMemoryRepository,
 )
 from chartrider.core.common.repository.eventmonitor.monitor import EventMonitor
 from chartrider.core.common.repository.models import Balance, Timeframe
@@ -32,11 +31,22 @@ def initial_balance() -> Balance:
 
 
 @pytest.fixture
-def contingent_repository(db_session_factory: DBSessionFactory) -> ContingentInfoBaseRepository:
-    # return ContingentInfoBacktestRepository(user_id="test")
+def contingent_repository(request: pytest.FixtureRequest) -> ContingentInfoBaseRepository:
+    # Resolved lazily, so that in-memory cases do not set up a database session at all.
+    # Tests that are not parametrized run against the database.
+    return request.getfixturevalue(getattr(request, "param", "contingent_db_repository"))
+
+
+@pytest.fixture
+def contingent_db_repository(db_session_factory: DBSessionFactory) -> ContingentInfoBaseRepository:
     return ContingentInfoDBRepository(db_session_factory, testnet=False, user_id="test")
 
 
+@pytest.fixture
+def contingent_inmemory_repository() -> ContingentInfoBaseRepository:
+    return ContingentInfoInMemoryRepository(user_id="test")
+
+
 @pytest.fixture
 def backtest_repository(
     initial_balance: Balance,
@@ -61,33 +71,52 @@ def backtest_broker(backtest_repository: BacktestRepository) -> BacktestBroker:
     return broker
 
 
+class FakeCandleSource:
+    """Stands in for the candle lookups of the backtest repository and broker, returning the assumed candle."""
+
+    __slots__ = ("last_ohlcv",)
+
+    # (open, high, low, close, volume, timestamp) of the assumed candle, the single state every lookup reads
+    last_ohlcv: tuple[float, float, float, float, float, int]
+
+    def get_last_price(self, symbol: Symbol) -> float:
+        return self.last_ohlcv[3]
+
+    def get_next_timestamp(self) -> int:
+        return self.last_ohlcv[5]
+
+    def get_last_ohlcv(self, symbol: Symbol) -> tuple[float, float, float, float, float, int]:
+        return self.last_ohlcv
+
+    def get_last_low_high(self, symbol: Symbol) -> tuple[float, float]:
+        return self.last_ohlcv[2], self.last_ohlcv[1]
+
+
 class CandleMocker:
-    class Candle(BaseModel):
+    class Candle(NamedTuple):
         open: float
         high: float
         low: float
         close: float
         volume: float
 
-        def tuple(self) -> tuple[float, float, float, float, float]:
-            return (self.open, self.high, self.low, self.close, self.volume)
-
     def __init__(self, mocker: MockerFixture, repository: BacktestRepository, broker: BacktestBroker):
         self.mocker = mocker
         self.repository = repository
         self.broker = broker
         self.current_timestamp: int = 1
+        self.source = FakeCandleSource()
+        self.is_patched = False
         self.mocker.patch.object(BacktestBroker, "data_length", return_value=DATA_LENGTH)
 
-    def patch_method(self, method: Callable, return_value: Any):
-        if isinstance(method, MagicMock):
-            method.return_value = return_value
-            return
-        self.mocker.patch.object(
-            method.__self__,
-            method.__name__,
-            return_value=return_value,
-        )
+    def patch_methods(self):
+        # Patched lazily, on the first assumed candle, so that the real methods stay in place
+        # for whatever a test does before that. Later candles only update the fake source.
+        self.mocker.patch.object(self.repository, "get_last_price", new=self.source.get_last_price)
+        self.mocker.patch.object(self.repository, "get_next_timestamp", new=self.source.get_next_timestamp)
+        self.mocker.patch.object(self.broker, "get_last_ohlcv", new=self.source.get_last_ohlcv)
+        self.mocker.patch.object(self.repository, "get_last_low_high", new=self.source.get_last_low_high)
+        self.is_patched = True
 
     def __construct_candle_with_defaults(
         self,
@@ -122,10 +151,9 @@ class CandleMocker:
         volume: int | None = None,
     ) -> int:
         candle = self.__construct_candle_with_defaults(open=open, high=high, low=low, close=close, volume=volume)
-        self.patch_method(self.repository.get_last_price, return_value=candle.close)
-        self.patch_method(self.repository.get_next_timestamp, return_value=self.current_timestamp)
-        self.patch_method(self.broker.get_last_ohlcv, return_value=(*candle.tuple(), self.current_timestamp))
-        self.patch_method(self.repository.get_last_low_high, return_value=(candle.low, candle.high))
+        if not self.is_patched:
+            self.patch_methods()
+        self.source.last_ohlcv = (*candle, self.current_timestamp)
         self.current_timestamp += 1
         return self.current_timestamp - 1
 
@@ -1,66 +1,82 @@
+import pytest
+
 from chartrider.core.backtest.broker import BacktestBroker
 from chartrider.core.backtest.repository import BacktestRepository
 from chartrider.core.common.repository.models import (
     MarginMode,
     OrderAction,
+    Position,
     TakerOrMaker,
 )
 from chartrider.tests.backtest.e2e.conftest import CandleMocker
 from chartrider.utils.symbols import Symbol
 
+SYMBOL = Symbol.BTC
+PRICE = 10000
+AMOUNT = 1
 
-def test_available_balance_with_isolated_position(
+
+@pytest.fixture
+def isolated_long_position(
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
-):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-    available_balance_before = backtest_repository.fetch_balance().availableBalance
-    fee_amount = price * amount * backtest_repository.get_fee_rate(TakerOrMaker.taker)
-    estimated_isolated_wallet = price * amount - fee_amount
+) -> Position:
+    """Opens a long position of `AMOUNT` at `PRICE` in isolated margin mode with leverage 1."""
     backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
+    backtest_repository.set_leverage(symbol=SYMBOL, leverage=1)
+    candle_mocker.assume_current_candle(close=PRICE)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.open_long,
-        amount=amount,
-        price=price,
+        amount=AMOUNT,
+        price=PRICE,
     )
     backtest_broker.next()
+    return backtest_repository.fetch_positions(symbols=[SYMBOL])[0]
 
-    balance = backtest_repository.fetch_balance()
-    assert balance.availableBalance == available_balance_before - estimated_isolated_wallet - fee_amount
 
+@pytest.fixture
+def estimated_isolated_wallet(backtest_repository: BacktestRepository) -> float:
+    """Isolated wallet of a position of `AMOUNT` opened at `PRICE` with leverage 1, net of the taker fee."""
+    return PRICE * AMOUNT * (1 - backtest_repository.get_fee_rate(TakerOrMaker.taker))
 
-def test_available_balance_should_remain_same_when_price_changes(
+
+def test_available_balance_with_isolated_position(
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
+    available_balance_before = backtest_repository.fetch_balance().availableBalance
+    fee_amount = PRICE * AMOUNT * backtest_repository.get_fee_rate(TakerOrMaker.taker)
+    estimated_isolated_wallet = PRICE * AMOUNT - fee_amount
     backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
+    backtest_repository.set_leverage(symbol=SYMBOL, leverage=1)
+    candle_mocker.assume_current_candle(close=PRICE)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.open_long,
-        amount=amount,
-        price=price,
+        amount=AMOUNT,
+        price=PRICE,
     )
     backtest_broker.next()
 
+    balance = backtest_repository.fetch_balance()
+    assert balance.availableBalance == available_balance_before - estimated_isolated_wallet - fee_amount
+
+
+def test_available_balance_should_remain_same_when_price_changes(
+    isolated_long_position: Position,
+    candle_mocker: CandleMocker,
+    backtest_repository: BacktestRepository,
+    backtest_broker: BacktestBroker,
+):
     available_balance_before = backtest_repository.fetch_balance().availableBalance
 
     # price changes
     candle_mocker.assume_current_candle(close=20000)
     backtest_broker.next()
-    candle_mocker.assume_current_candle(close=int(price - 1000))
+    candle_mocker.assume_current_candle(close=PRICE - 1000)
     backtest_broker.next()
 
     available_balance_after = backtest_repository.fetch_balance().availableBalance
@@ -68,34 +84,19 @@ def test_available_balance_should_remain_same_when_price_changes(
 
 
 def test_isolated_wallet_should_remain_same_when_price_changes(
+    isolated_long_position: Position,
+    estimated_isolated_wallet: float,
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
-    estimated_isolated_wallet = price * amount * (1 - backtest_repository.get_fee_rate(TakerOrMaker.taker))
-    backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
-    backtest_repository.create_order(
-        symbol=symbol,
-        action=OrderAction.open_long,
-        amount=amount,
-        price=price,
-    )
-    backtest_broker.next()
-
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
-    assert long_position.isolatedWallet == estimated_isolated_wallet
+    assert isolated_long_position.isolatedWallet == estimated_isolated_wallet
 
     # price changes
-    candle_mocker.assume_current_candle(close=int(price * 2))
+    candle_mocker.assume_current_candle(close=PRICE * 2)
     backtest_broker.next()
 
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
+    long_position = backtest_repository.fetch_positions(symbols=[SYMBOL])[0]
     assert long_position.isolatedWallet == estimated_isolated_wallet
 
 
@@ -104,128 +105,80 @@ def test_isolated_wallet_should_be_none_in_cross_mode(
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
-    backtest_repository.set_margin_mode(symbol=symbol, margin_mode=MarginMode.cross)
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
+    backtest_repository.set_margin_mode(symbol=SYMBOL, margin_mode=MarginMode.cross)
+    backtest_repository.set_leverage(symbol=SYMBOL, leverage=1)
+    candle_mocker.assume_current_candle(close=PRICE)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.open_long,
-        amount=amount,
-        price=price,
+        amount=AMOUNT,
+        price=PRICE,
     )
     backtest_broker.next()
 
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
+    long_position = backtest_repository.fetch_positions(symbols=[SYMBOL])[0]
     assert long_position.isolatedWallet == 0
 
 
 def test_isolated_wallet_increase_when_position_added(
+    isolated_long_position: Position,
+    estimated_isolated_wallet: float,
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
-    estimated_isolated_wallet = price * amount * (1 - backtest_repository.get_fee_rate(TakerOrMaker.taker))
-    backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
-    backtest_repository.create_order(
-        symbol=symbol,
-        action=OrderAction.open_long,
-        amount=amount,
-        price=price,
-    )
-    backtest_broker.next()
-
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
-    assert long_position.isolatedWallet == estimated_isolated_wallet
+    assert isolated_long_position.isolatedWallet == estimated_isolated_wallet
 
     # add position
-    candle_mocker.assume_current_candle(close=int(price))
+    candle_mocker.assume_current_candle(close=PRICE)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.open_long,
-        amount=amount,
-        price=price,
+        amount=AMOUNT,
+        price=PRICE,
     )
     backtest_broker.next()
 
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
+    long_position = backtest_repository.fetch_positions(symbols=[SYMBOL])[0]
     assert long_position.isolatedWallet == estimated_isolated_wallet * 2
 
 
 def test_isolated_wallet_decrease_when_position_partially_closed(
+    isolated_long_position: Position,
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
-    backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
-    backtest_repository.create_order(
-        symbol=symbol,
-        action=OrderAction.open_long,
-        amount=amount,
-        price=price,
-    )
-    backtest_broker.next()
-
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
-    isolated_wallet = long_position.isolatedWallet
+    isolated_wallet = isolated_long_position.isolatedWallet
 
     # close position
-    new_price = price * 2
-    candle_mocker.assume_current_candle(close=int(new_price))
+    new_price = PRICE * 2
+    candle_mocker.assume_current_candle(close=new_price)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.close_long,
-        amount=amount / 2,
+        amount=AMOUNT / 2,
         price=new_price,
     )
     backtest_broker.next()
 
-    long_position = backtest_repository.fetch_positions(symbols=[symbol])[0]
+    long_position = backtest_repository.fetch_positions(symbols=[SYMBOL])[0]
     assert long_position.isolatedWallet == isolated_wallet / 2
 
 
 def test_isolated_wallet_should_be_zero_when_position_closed(
+    isolated_long_position: Position,
     candle_mocker: CandleMocker,
     backtest_repository: BacktestRepository,
     backtest_broker: BacktestBroker,
 ):
-    symbol = Symbol.BTC
-    price = 10000
-    amount = 1
-
-    backtest_broker.set_isolated_margin_mode()
-    backtest_repository.set_leverage(symbol=symbol, leverage=1)
-    candle_mocker.assume_current_candle(close=int(price))
-    backtest_repository.create_order(
-        symbol=symbol,
-        action=OrderAction.open_long,
-        amount=amount,
-        price=price,
-    )
-    backtest_broker.next()
-
     # close position
-    new_price = price * 2
-    candle_mocker.assume_current_candle(close=int(new_price))
+    new_price = PRICE * 2
+    candle_mocker.assume_current_candle(close=new_price)
     backtest_repository.create_order(
-        symbol=symbol,
+        symbol=SYMBOL,
         action=OrderAction.close_long,
-        amount=amount,
+        amount=AMOUNT,
         price=new_price,
     )
     backtest_broker.next()
@@ -1,9 +1,24 @@
 import pytest
 
 from chartrider.core.common.repository import CandleDBRepository
+from chartrider.core.common.repository.models import Timeframe
 from chartrider.database.connection import DBSessionFactory
+from chartrider.utils.symbols import Symbol
+
+SEED_OHLCVS = [
+    (0, 1, 2, 3, 4, 5),
+    (1, 1, 2, 3, 4, 5),
+    (2, 1, 2, 3, 4, 5),
+]
 
 
 @pytest.fixture
 def candle_db_repository(db_session_factory: DBSessionFactory) -> CandleDBRepository:
     return CandleDBRepository(db_session_factory)
+
+
+@pytest.fixture
+def seeded_candle_db_repository(candle_db_repository: CandleDBRepository) -> CandleDBRepository:
+    """`candle_db_repository` with `SEED_OHLCVS` stored as BTC 1m candles."""
+    candle_db_repository.update_or_create_candles(Symbol.BTC, Timeframe.m1, SEED_OHLCVS)
+    return candle_db_repository
@@ -6,12 +6,13 @@ from chartrider.core.common.repository.contingent.repository import (
 from chartrider.core.common.repository.models import ContingentOrder, PositionSide
 from chartrider.utils.symbols import Symbol
 
-
-@pytest.mark.parametrize(
+pytestmark = pytest.mark.parametrize(
     "contingent_repository",
     ["contingent_db_repository", "contingent_inmemory_repository"],
     indirect=True,
 )
+
+
 def test_trigger_contingent_info(
     contingent_repository: ContingentInfoBaseRepository,
 ):
@@ -29,11 +30,6 @@ def test_trigger_contingent_info(
     assert contingent_info.is_triggered
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_create_and_retrieve_contingent_info(contingent_repository: ContingentInfoBaseRepository):
     order_id = "create_test"
     symbol = Symbol.BTC
@@ -45,11 +41,6 @@ def test_create_and_retrieve_contingent_info(contingent_repository: ContingentIn
     assert contingent_info.side == PositionSide.long
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_contingent_info(contingent_repository: ContingentInfoBaseRepository):
     order_id = "delete_test"
     symbol = Symbol.BTC
@@ -59,11 +50,6 @@ def test_delete_contingent_info(contingent_repository: ContingentInfoBaseReposit
     assert contingent_info is None
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_get_all_contingent_infos(contingent_repository: ContingentInfoBaseRepository):
     order_ids = ["order1", "order2", "order3"]
     for oid in order_ids:
@@ -72,11 +58,6 @@ def test_get_all_contingent_infos(contingent_repository: ContingentInfoBaseRepos
     assert len(all_contingent_infos) == len(order_ids)
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_pending_by_symbol(contingent_repository: ContingentInfoBaseRepository):
     symbol = Symbol.BTC
     order_id1 = "pending_1"
@@ -88,11 +69,6 @@ def test_delete_pending_by_symbol(contingent_repository: ContingentInfoBaseRepos
     assert len(contingent_infos) == 0
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_pending_contingent_info_with_multiple_symbols(contingent_repository: ContingentInfoBaseRepository):
     contingent_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
     contingent_repository.create_contingent_info("btc-2", Symbol.BTC, PositionSide.long)
@@ -112,11 +88,6 @@ def test_delete_pending_contingent_info_with_multiple_symbols(contingent_reposit
     assert pending_infos[0].order_id == "eth-2"
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_pending_contingent_info_with_multiple_symbols_and_sides(
     contingent_repository: ContingentInfoBaseRepository,
 ):
@@ -135,11 +106,6 @@ def test_delete_pending_contingent_info_with_multiple_symbols_and_sides(
     assert pending_infos[0].order_id == "eth-2"
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_pending_contingent_info_with_sides(contingent_repository: ContingentInfoBaseRepository):
     contingent_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
     contingent_repository.create_contingent_info("btc-2", Symbol.BTC, PositionSide.long)
@@ -158,11 +124,6 @@ def test_delete_pending_contingent_info_with_sides(contingent_repository: Contin
         assert info.side == PositionSide.short
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_mark_non_existent_contingent_info(contingent_repository: ContingentInfoBaseRepository):
     contingent_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
 
@@ -175,11 +136,6 @@ def test_mark_non_existent_contingent_info(contingent_repository: ContingentInfo
     assert pending_infos[0].order_id == "btc-1"
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_is_liquidated_by_contingent(contingent_repository: ContingentInfoBaseRepository):
     order_id = "liquidation_test"
     symbol = Symbol.BTC
@@ -192,22 +148,12 @@ def test_is_liquidated_by_contingent(contingent_repository: ContingentInfoBaseRe
     assert is_liquidated is True
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_is_liquidated_by_contingent_non_existent(contingent_repository: ContingentInfoBaseRepository):
     order_id = "liquidation_test"
     is_liquidated = contingent_repository.is_liquidated_by_contingent(order_id, Symbol.BTC)
     assert is_liquidated is False
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_get_pending_contingent_infos(contingent_repository: ContingentInfoBaseRepository):
     # Create two contingent info, one triggered and one pending
     contingent_repository.create_contingent_info("123", Symbol.BTC, PositionSide.long)
@@ -9,12 +9,13 @@ from chartrider.tests.common.repository.contingent.conftest import (
 )
 from chartrider.utils.symbols import Symbol
 
-
-@pytest.mark.parametrize(
+pytestmark = pytest.mark.parametrize(
     "contingent_repository",
     ["contingent_db_repository", "contingent_inmemory_repository"],
     indirect=True,
 )
+
+
 def test_trigger_contingent_info_with_multiple_user(
     contingent_repository: ContingentInfoBaseRepository,
     contingent_repository_factory: ContingentRepositoryFactory,
@@ -30,11 +31,6 @@ def test_trigger_contingent_info_with_multiple_user(
     assert not another_repository.is_liquidated_by_contingent("btc-1", Symbol.BTC)
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_trigger_contingent_info_with_different_network(
     contingent_repository: ContingentInfoBaseRepository,
     contingent_repository_factory: ContingentRepositoryFactory,
@@ -50,11 +46,6 @@ def test_trigger_contingent_info_with_different_network(
     assert not another_repository.is_liquidated_by_contingent("btc-1", Symbol.BTC)
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_delete_pending_with_multiple_user(
     contingent_repository: ContingentInfoBaseRepository,
     contingent_repository_factory: ContingentRepositoryFactory,
@@ -63,10 +54,14 @@ def test_delete_pending_with_multiple_user(
         user_id="another_user", testnet=False, base_repository=contingent_repository
     )
 
-    contingent_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
-    contingent_repository.create_contingent_info("btc-2", Symbol.BTC, PositionSide.long)
-    contingent_repository.create_contingent_info("eth-1", Symbol.ETH, PositionSide.long)
-    contingent_repository.create_contingent_info("eth-2", Symbol.ETH, PositionSide.long)
+    contingent_repository.create_contingent_infos(
+        [
+            ("btc-1", Symbol.BTC, PositionSide.long),
+            ("btc-2", Symbol.BTC, PositionSide.long),
+            ("eth-1", Symbol.ETH, PositionSide.long),
+            ("eth-2", Symbol.ETH, PositionSide.long),
+        ]
+    )
 
     another_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
 
@@ -75,11 +70,6 @@ def test_delete_pending_with_multiple_user(
     assert len(contingent_repository.get_pending_contingent_infos()) == 2
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_get_pending_contingent_infos_different_user(
     contingent_repository: ContingentInfoBaseRepository,
     contingent_repository_factory: ContingentRepositoryFactory,
@@ -89,10 +79,14 @@ def test_get_pending_contingent_infos_different_user(
     )
     another_repository.create_contingent_info("btc-1", Symbol.ETH, PositionSide.long)
 
-    contingent_repository.create_contingent_info("btc-1", Symbol.BTC, PositionSide.long)
-    contingent_repository.create_contingent_info("btc-2", Symbol.BTC, PositionSide.long)
-    contingent_repository.create_contingent_info("eth-1", Symbol.ETH, PositionSide.long)
-    contingent_repository.create_contingent_info("eth-2", Symbol.ETH, PositionSide.long)
+    contingent_repository.create_contingent_infos(
+        [
+            ("btc-1", Symbol.BTC, PositionSide.long),
+            ("btc-2", Symbol.BTC, PositionSide.long),
+            ("eth-1", Symbol.ETH, PositionSide.long),
+            ("eth-2", Symbol.ETH, PositionSide.long),
+        ]
+    )
 
     contingent_repository.mark_contingent_info_as_triggered("btc-1", Symbol.BTC)
     another_repository.mark_contingent_info_as_triggered("btc-1", Symbol.BTC)  # noop
@@ -104,11 +98,6 @@ def test_get_pending_contingent_infos_different_user(
     assert len(another_pending_infos) == 1
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_same_order_id_with_different_symbol(contingent_repository: ContingentInfoBaseRepository):
     contingent_repository.create_contingent_info("same", Symbol.BTC, PositionSide.long)
     contingent_repository.create_contingent_info("same", Symbol.ETH, PositionSide.long)
@@ -118,11 +107,6 @@ def test_same_order_id_with_different_symbol(contingent_repository: ContingentIn
     assert not contingent_repository.is_liquidated_by_contingent("same", Symbol.ETH)
 
 
-@pytest.mark.parametrize(
-    "contingent_repository",
-    ["contingent_db_repository", "contingent_inmemory_repository"],
-    indirect=True,
-)
 def test_cant_create_if_only_differs_side(contingent_repository: ContingentInfoBaseRepository):
     contingent_repository.create_contingent_info("same", Symbol.BTC, PositionSide.long)
     with pytest.raises(Exception):
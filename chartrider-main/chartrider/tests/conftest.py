@@ -1,26 +1,71 @@
+import hashlib
+import os
 from typing import Iterable
 
 import pytest
 import sqlalchemy
-from pytest_mock import MockFixture
 from sqlalchemy import orm
+from sqlalchemy.schema import CreateTable
 
 from chartrider.database.base import DeclarativeBase
 from chartrider.database.connection import DBSessionFactory
 from chartrider.settings import postgres_settings as db_config
 
+# Records which schema the test tables were created with, so that reruns can keep them.
+_schema_version_table = sqlalchemy.Table(
+    "_schema_version",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("version", sqlalchemy.Text, primary_key=True),
+)
+
+
+def _schema_version(engine: sqlalchemy.Engine) -> str:
+    ddl = [str(CreateTable(table).compile(dialect=engine.dialect)) for table in DeclarativeBase.metadata.sorted_tables]
+    return hashlib.sha256("".join(ddl).encode()).hexdigest()
+
+
+def _clear_tables(connection: sqlalchemy.Connection) -> None:
+    for table in reversed(DeclarativeBase.metadata.sorted_tables):
+        connection.execute(table.delete())
+
+
+def _ensure_schema(engine: sqlalchemy.Engine) -> None:
+    """Create the test tables, unless the ones left by a previous run already match the current models."""
+    version = _schema_version(engine)
+    _schema_version_table.create(bind=engine, checkfirst=True)
+    with engine.begin() as connection:
+        if connection.scalar(sqlalchemy.select(_schema_version_table.c.version)) == version:
+            # a previous run that was killed may not have cleaned up after itself
+            _clear_tables(connection)
+            return
+        DeclarativeBase.metadata.drop_all(bind=connection)
+        DeclarativeBase.metadata.create_all(bind=connection)
+        connection.execute(_schema_version_table.delete())
+        connection.execute(_schema_version_table.insert().values(version=version))
+
 
 @pytest.fixture(scope="session")
 def db_engine() -> Iterable[sqlalchemy.Engine]:
     url = db_config.test_url
-    engine = sqlalchemy.create_engine(url, echo=True)
-    DeclarativeBase.metadata.create_all(bind=engine)
+    base_engine = sqlalchemy.create_engine(url)
+    engine = base_engine
+
+    # under pytest-xdist, give each worker its own schema so that parallel workers do not share tables
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        with base_engine.begin() as connection:
+            connection.execute(sqlalchemy.schema.CreateSchema(worker, if_not_exists=True))
+        engine = base_engine.execution_options(schema_translate_map={None: worker})
+
+    _ensure_schema(engine)
 
     try:
         yield engine
     finally:
-        DeclarativeBase.metadata.drop_all(bind=engine)
-        engine.dispose()
+        # keep the tables for the next run, only their rows go
+        with engine.begin() as connection:
+            _clear_tables(connection)
+        base_engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -43,9 +88,23 @@ def db_session(db_engine: sqlalchemy.Engine) -> Iterable[orm.Session]:
         connection.close()
 
 
-@pytest.fixture(scope="function")
-def db_session_factory(mocker: MockFixture, db_session: orm.Session) -> DBSessionFactory:
+@pytest.fixture(scope="session")
+def shared_db_session_factory() -> Iterable[DBSessionFactory]:
+    # Building the factory creates an engine, so it is done once; each test only swaps the session it hands out.
     db_session_factory = DBSessionFactory()
-    method_to_patch = db_session_factory.scoped_session
-    mocker.patch.object(method_to_patch.__self__, method_to_patch.__name__, return_value=db_session)
-    return db_session_factory
+    try:
+        yield db_session_factory
+    finally:
+        db_session_factory.teardown()
+
+
+@pytest.fixture(scope="function")
+def db_session_factory(
+    shared_db_session_factory: DBSessionFactory, db_session: orm.Session
+) -> Iterable[DBSessionFactory]:
+    # shadow the method with an instance attribute; deleting it afterwards restores the class method
+    shared_db_session_factory.scoped_session = lambda: db_session  # type: ignore[method-assign]
+    try:
+        yield shared_db_session_factory
+    finally:
+        del shared_db_session_factory.scoped_session
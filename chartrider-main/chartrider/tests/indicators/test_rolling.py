@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chartrider.indicators import RollingCache
+
+
+@pytest.fixture
+def candles() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2023-01-01", periods=300, freq="1min", tz="UTC")
+    return pd.DataFrame(rng.random((300, 2)) * 100, index=index, columns=["BTC", "ETH"])
+
+
+@pytest.mark.parametrize("method", ["mean", "max", "min"])
+def test_appended_candles(candles: pd.DataFrame, method: str):
+    cache = RollingCache()
+    cache.rolling("close", candles.iloc[:200], 30, method)  # type: ignore
+    result = cache.rolling("close", candles, 30, method)  # type: ignore
+    pd.testing.assert_frame_equal(result, getattr(candles.rolling(30), method)())
+
+
+@pytest.mark.parametrize("method", ["mean", "max", "min"])
+def test_truncated_head(candles: pd.DataFrame, method: str):
+    cache = RollingCache()
+    cache.rolling("close", candles.iloc[:200], 30, method)  # type: ignore
+    result = cache.rolling("close", candles.iloc[50:], 30, method)  # type: ignore
+    pd.testing.assert_frame_equal(result, getattr(candles.iloc[50:].rolling(30), method)())
+
+
+def test_last_candle_is_recomputed(candles: pd.DataFrame):
+    cache = RollingCache()
+    cache.mean("close", candles.iloc[:200], 30)
+
+    updated = candles.iloc[:200].copy()
+    updated.iloc[-1] = 1000.0
+    pd.testing.assert_frame_equal(cache.mean("close", updated, 30), updated.rolling(30).mean())
+
+
+def test_unrelated_input_is_recomputed(candles: pd.DataFrame):
+    cache = RollingCache()
+    cache.max("high", candles.iloc[:100], 30)
+    result = cache.max("high", candles.iloc[150:], 30)
+    pd.testing.assert_frame_equal(result, candles.iloc[150:].rolling(30).max())
+
+
+def test_same_candles_hit_the_cache(candles: pd.DataFrame):
+    cache = RollingCache()
+    first = cache.mean("close", candles, 30)
+    assert cache.mean("close", candles.copy(), 30) is first
+
+    updated = candles.copy()
+    updated.iloc[-1] = 1000.0
+    pd.testing.assert_frame_equal(cache.mean("close", updated, 30), updated.rolling(30).mean())
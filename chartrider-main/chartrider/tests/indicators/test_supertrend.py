@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from chartrider.indicators import supertrend
+
+
+def wilder_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Reference ATR with the same semantics as `talib.ATR`."""
+    atr = np.full(len(high), np.nan)
+    true_range = np.full(len(high), np.nan)
+    for i in range(1, len(high)):
+        true_range[i] = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    if len(high) > period:
+        atr[period] = true_range[1 : period + 1].mean()
+        for i in range(period + 1, len(high)):
+            atr[i] = (atr[i - 1] * (period - 1) + true_range[i]) / period
+    return atr
+
+
+def reference_supertrend(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    atr_multiplier: float,
+    reference: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The straightforward implementation that recomputes the band extrema on every candle."""
+    if reference is None:
+        reference = (high + low) / 2
+
+    atr = wilder_atr(high, low, close, period)
+    upper_band = reference - (atr_multiplier * atr)
+    lower_band = reference + (atr_multiplier * atr)
+    upper_band_list = [upper_band[0]]
+    lower_band_list = [lower_band[0]]
+    num_upper_band_crosses = 0
+    num_lower_band_crosses = 0
+
+    trend = 1
+    trend_list = [trend]
+
+    for i in range(1, len(high)):
+        if trend == 1:
+            if close[i] > max(upper_band[num_upper_band_crosses:i]):
+                upper_band_list.append(max(upper_band[num_upper_band_crosses:i]))
+                lower_band_list.append(np.nan)
+            else:
+                trend = -1
+                num_lower_band_crosses = i
+                upper_band_list.append(np.nan)
+                lower_band_list.append(lower_band[i])
+        else:
+            if close[i] < min(lower_band[num_lower_band_crosses:i]):
+                upper_band_list.append(np.nan)
+                lower_band_list.append(min(lower_band[num_lower_band_crosses:i]))
+            else:
+                trend = 1
+                num_upper_band_crosses = i
+                upper_band_list.append(upper_band[i])
+                lower_band_list.append(np.nan)
+        trend_list.append(trend)
+
+    return np.array(upper_band_list), np.array(lower_band_list), np.array(trend_list)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("with_reference", [False, True])
+def test_supertrend_matches_reference(seed: int, with_reference: bool):
+    rng = np.random.default_rng(seed)
+    length = int(rng.integers(1, 400))
+    close = 100 + np.cumsum(rng.normal(size=length))
+    high = close + rng.random(length)
+    low = close - rng.random(length)
+    period = int(rng.integers(1, 20))
+    atr_multiplier = float(rng.random() * 3)
+    reference = (high + low + close) / 3 if with_reference else None
+
+    result = supertrend(high, low, close, period=period, atr_multiplier=atr_multiplier, reference=reference)
+    upper_band, lower_band, trend = reference_supertrend(high, low, close, period, atr_multiplier, reference)
+
+    np.testing.assert_allclose(result.upper_band, upper_band, equal_nan=True)
+    np.testing.assert_allclose(result.lower_band, lower_band, equal_nan=True)
+    np.testing.assert_array_equal(result.trend, trend)
+
+
+def test_supertrend_empty_input():
+    empty = np.array([], dtype=float)
+    result = supertrend(empty, empty, empty)
+    assert len(result.upper_band) == len(result.lower_band) == len(result.trend) == 0
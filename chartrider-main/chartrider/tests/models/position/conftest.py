@@ -1,7 +1,9 @@
 import pytest
 
+from chartrider.core.common.repository.models import Position
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def ccxt_isolated_position_data() -> dict:
     return {
         "info": {
@@ -47,7 +49,7 @@ def ccxt_isolated_position_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ccxt_cross_position_data() -> dict:
     return {
         "info": {
@@ -91,3 +93,14 @@ def ccxt_cross_position_data() -> dict:
         "hedged": True,
         "percentage": -1.1,
     }
+
+
+# Validated once per module and shared by the tests that only read it; tests that modify a position build their own.
+@pytest.fixture(scope="module")
+def isolated_position(ccxt_isolated_position_data: dict) -> Position:
+    return Position(**ccxt_isolated_position_data)
+
+
+@pytest.fixture(scope="module")
+def cross_position(ccxt_cross_position_data: dict) -> Position:
+    return Position(**ccxt_cross_position_data)
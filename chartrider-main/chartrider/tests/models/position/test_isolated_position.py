@@ -3,9 +3,8 @@ import pytest
 from chartrider.core.common.repository.models import MarginMode, Position
 
 
-def test_set_isolated_wallet(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert position.isolatedWallet == float(ccxt_isolated_position_data["info"]["isolatedWallet"])
+def test_set_isolated_wallet(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert isolated_position.isolatedWallet == float(ccxt_isolated_position_data["info"]["isolatedWallet"])
 
 
 def test_set_isolated_wallet_in_cross_mode(ccxt_isolated_position_data: dict):
@@ -38,40 +37,34 @@ def test_set_isolated_wallet_value_changed(ccxt_isolated_position_data: dict):
     assert position.isolatedWallet == 100
 
 
-def test_isolated_position_maintenance_margin(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert pytest.approx(position.maintenanceMargin) == ccxt_isolated_position_data["maintenanceMargin"]
+def test_isolated_position_maintenance_margin(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert pytest.approx(isolated_position.maintenanceMargin) == ccxt_isolated_position_data["maintenanceMargin"]
 
 
-def test_isolated_position_margin_ratio(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert pytest.approx(position.marginRatio, abs=1e-4) == ccxt_isolated_position_data["marginRatio"]
+def test_isolated_position_margin_ratio(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert pytest.approx(isolated_position.marginRatio, abs=1e-4) == ccxt_isolated_position_data["marginRatio"]
 
 
-def test_isolated_position_collateral(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert pytest.approx(position.collateral) == ccxt_isolated_position_data["collateral"]
+def test_isolated_position_collateral(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert pytest.approx(isolated_position.collateral) == ccxt_isolated_position_data["collateral"]
 
 
-def test_isolated_position_isolated_margin(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert pytest.approx(position.isolatedMargin, abs=1e-7) == float(
+def test_isolated_position_isolated_margin(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert pytest.approx(isolated_position.isolatedMargin, abs=1e-7) == float(
         ccxt_isolated_position_data["info"]["isolatedMargin"]
     )
 
 
-def test_isolated_position_unrealized_pnl(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert pytest.approx(float(position.unrealizedPnl)) == float(
+def test_isolated_position_unrealized_pnl(isolated_position: Position, ccxt_isolated_position_data: dict):
+    assert pytest.approx(float(isolated_position.unrealizedPnl)) == float(
         ccxt_isolated_position_data["info"]["unRealizedProfit"]
     )
 
 
-def test_isolated_position_margin_mode(ccxt_isolated_position_data: dict):
-    position = Position(**ccxt_isolated_position_data)
-    assert position.marginMode == MarginMode.isolated
-    assert position.marginMode == MarginMode.isolated.value
-    assert position.marginMode == "isolated"
+def test_isolated_position_margin_mode(isolated_position: Position):
+    assert isolated_position.marginMode == MarginMode.isolated
+    assert isolated_position.marginMode == MarginMode.isolated.value
+    assert isolated_position.marginMode == "isolated"
 
 
 def test_isolated_position_liquidation_price(ccxt_isolated_position_data: dict):
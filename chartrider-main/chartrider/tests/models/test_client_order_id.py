@@ -13,6 +13,25 @@ from chartrider.core.common.repository.models import (
 from chartrider.utils.symbols import Symbol
 
 
+def make_order(client_order_id: str) -> Order:
+    """An open buy stop order, built through validation so that `client_order_id` is decoded."""
+    return Order(
+        id="12345",
+        timestamp=None,
+        symbol=Symbol.BTC,
+        price=None,
+        amount=0,
+        stopPrice=None,
+        status=OrderStatus.open,
+        type=OrderType.stop,
+        side=OrderSide.buy,
+        trades=[],
+        filled=0,
+        clientOrderId=client_order_id,
+        timeInForce=TimeInForce.GTC,
+    )
+
+
 def test_from_id():
     raw_id = "vb03_12345_abc"
     client_order_id = ClientOrderId.decode(raw_id)
@@ -46,42 +65,14 @@ def test_invalid_from_id2():
 
 def test_order_invalid_client_id():
     raw_id = "vb04_12345"
-    order = Order(
-        id="12345",
-        timestamp=None,
-        symbol=Symbol.BTC,
-        price=None,
-        amount=0,
-        stopPrice=None,
-        status=OrderStatus.open,
-        type=OrderType.stop,
-        side=OrderSide.buy,
-        trades=[],
-        filled=0,
-        clientOrderId=raw_id,
-        timeInForce=TimeInForce.GTC,
-    )
+    order = make_order(raw_id)
     assert order.clientOrderId is None
     assert order.clientOrderId == ClientOrderId.decode(raw_id)
 
 
 def test_order_valid_client_id():
     raw_id = "vb04_123_45"
-    order = Order(
-        id="12345",
-        timestamp=None,
-        symbol=Symbol.BTC,
-        price=None,
-        amount=0,
-        stopPrice=None,
-        status=OrderStatus.open,
-        type=OrderType.stop,
-        side=OrderSide.buy,
-        trades=[],
-        filled=0,
-        clientOrderId=raw_id,
-        timeInForce=TimeInForce.GTC,
-    )
+    order = make_order(raw_id)
     assert isinstance(order.clientOrderId, ClientOrderId)
     assert order.clientOrderId == ClientOrderId.decode(raw_id)
     assert order.clientOrderId.identifier == "45"
@@ -89,42 +80,14 @@ def test_order_valid_client_id():
 
 def test_order_valid_client_id_to_invalid():
     raw_id = "vb04_12345_abc"
-    order = Order(
-        id="12345",
-        timestamp=None,
-        symbol=Symbol.BTC,
-        price=None,
-        amount=0,
-        stopPrice=None,
-        status=OrderStatus.open,
-        type=OrderType.stop,
-        side=OrderSide.buy,
-        trades=[],
-        filled=0,
-        clientOrderId=raw_id,
-        timeInForce=TimeInForce.GTC,
-    )
+    order = make_order(raw_id)
     order.clientOrderId = "vb04_123_abc_db"
     assert order.clientOrderId is None
 
 
 def test_order_invalid_client_id_to_valid():
     raw_id = "vb04_123_45_abc"
-    order = Order(
-        id="12345",
-        timestamp=None,
-        symbol=Symbol.BTC,
-        price=None,
-        amount=0,
-        stopPrice=None,
-        status=OrderStatus.open,
-        type=OrderType.stop,
-        side=OrderSide.buy,
-        trades=[],
-        filled=0,
-        clientOrderId=raw_id,
-        timeInForce=TimeInForce.GTC,
-    )
+    order = make_order(raw_id)
     order.clientOrderId = "vb04_12345_abc"
     assert isinstance(order.clientOrderId, ClientOrderId)
     assert order.clientOrderId.strategy == "vb04"
@@ -178,3 +141,18 @@ def test_client_order_id_identifier_preserved():
     decoded = ClientOrderId.decode(encoded)
     assert decoded is not None
     assert client_order_id == decoded
+
+
+def test_client_order_id_trusted():
+    validated = ClientOrderId(strategy="vb03", timestamp=12345)
+    trusted = ClientOrderId.trusted("vb03", 12345)
+    assert trusted.strategy == validated.strategy
+    assert trusted.timestamp == validated.timestamp
+    assert trusted.identifier is not None
+    assert len(trusted.identifier) == len(validated.identifier or "")
+
+    encoded = trusted.encode()
+    assert encoded is not None
+    assert len(encoded) == 36
+    assert encoded == "vb03_12345_" + trusted.identifier
+    assert ClientOrderId.decode(encoded) == trusted
@@ -0,0 +1,47 @@
+import pytest
+
+from chartrider.core.common.repository.models import OrderAction, OrderSide, PositionSide
+
+
+@pytest.mark.parametrize(
+    "side, is_buy, is_sell",
+    [
+        (OrderSide.buy, True, False),
+        (OrderSide.sell, False, True),
+    ],
+)
+def test_order_side_flags(side: OrderSide, is_buy: bool, is_sell: bool):
+    assert side.isBuy is is_buy
+    assert side.isSell is is_sell
+
+
+@pytest.mark.parametrize(
+    "side, is_long, is_short",
+    [
+        (PositionSide.long, True, False),
+        (PositionSide.short, False, True),
+    ],
+)
+def test_position_side_flags(side: PositionSide, is_long: bool, is_short: bool):
+    assert side.isLong is is_long
+    assert side.isShort is is_short
+
+
+@pytest.mark.parametrize(
+    "action, is_opening, is_closing",
+    [
+        (OrderAction.open_long, True, False),
+        (OrderAction.open_short, True, False),
+        (OrderAction.close_long, False, True),
+        (OrderAction.close_short, False, True),
+    ],
+)
+def test_order_action_flags(action: OrderAction, is_opening: bool, is_closing: bool):
+    assert action.isOpening is is_opening
+    assert action.isClosing is is_closing
+
+
+def test_every_member_has_exactly_one_flag_set():
+    assert all(side.isBuy != side.isSell for side in OrderSide)
+    assert all(side.isLong != side.isShort for side in PositionSide)
+    assert all(action.isOpening != action.isClosing for action in OrderAction)
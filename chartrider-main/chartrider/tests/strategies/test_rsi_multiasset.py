@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+from chartrider.strategies.rsi_multiasset import _cs_rank
+
+
+def test_cs_rank_matches_row_wise_apply():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((50, 4)), columns=["a", "b", "c", "d"])
+    df.iloc[:2] = np.nan
+    df.iloc[5, 1] = np.nan
+
+    expected = df.apply(lambda x: (x.rank() - 1) / (len(x) - x.isna().sum() - 1), axis=1)
+    pd.testing.assert_frame_equal(_cs_rank(df), expected)
+
+
+def test_cs_rank_bounds():
+    df = pd.DataFrame([[3.0, 1.0, 2.0], [1.0, np.nan, 5.0]])
+    ranks = _cs_rank(df)
+    assert ranks.iloc[0].tolist() == [1.0, 0.0, 0.5]
+    assert ranks.iloc[1, 0] == 0.0 and ranks.iloc[1, 2] == 1.0
+    assert np.isnan(ranks.iloc[1, 1])
@@ -0,0 +1,35 @@
+import gc
+
+from chartrider.strategies.volatility_breakout import VolatilityBreakout
+from chartrider.utils.symbols import Symbol
+
+
+class FakeBroker:
+    pass
+
+
+def make_strategy(broker: FakeBroker, reference_hour: int) -> VolatilityBreakout:
+    strategy = VolatilityBreakout(symbol=Symbol.BTC, reference_hour=reference_hour)
+    strategy.broker = broker  # type: ignore
+    return strategy
+
+
+def test_rolling_cache_is_shared_within_a_run():
+    broker = FakeBroker()
+    assert make_strategy(broker, 0).rolling_cache is make_strategy(broker, 1).rolling_cache
+
+
+def test_rolling_cache_is_not_shared_across_runs():
+    assert make_strategy(FakeBroker(), 0).rolling_cache is not make_strategy(FakeBroker(), 0).rolling_cache
+
+
+def test_rolling_cache_is_dropped_with_its_broker():
+    broker = FakeBroker()
+    strategy = make_strategy(broker, 0)
+    strategy.rolling_cache
+    caches = VolatilityBreakout._VolatilityBreakout__rolling_caches  # type: ignore
+    assert broker in caches
+
+    del strategy, broker
+    gc.collect()
+    assert not any(isinstance(key, FakeBroker) for key in caches.keys())
@@ -1,6 +1,10 @@
+import copy
 import math
+from functools import cache
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from chartrider.utils.data import MultiAssetCandleData
 from chartrider.utils.symbols import Symbol
@@ -12,24 +16,41 @@ def generate_candle_data(
     rows: int,
     leading_nan_rows: int = 0,
 ) -> MultiAssetCandleData:
-    candle_dicts = [
-        dict(
-            timestamp=1627776000000 + (timestamp_offset + i) * 1000,
-            open=i,
-            high=i + 1,
-            low=i + 2,
-            close=i + 3,
-            volume=i + 4,
-        )
-        for i in range(rows)
-    ]
-
-    dataframe = pd.DataFrame(candle_dicts)
-    dataframe["date"] = pd.to_datetime(dataframe["timestamp"], unit="ms", utc=True)
-    dataframe.drop("timestamp", axis=1, inplace=True)
-    dataframe.interpolate(method="ffill", inplace=True)  # type: ignore
-    dataframe.set_index("date", inplace=True)
+    # hand out a copy, so that tests modifying their data do not affect the cached frame
+    return MultiAssetCandleData(_generate_candle_dataframe(symbol, timestamp_offset, rows, leading_nan_rows).copy())
+
+
+@cache
+def _generate_candle_dataframe(
+    symbol: Symbol,
+    timestamp_offset: int,
+    rows: int,
+    leading_nan_rows: int,
+) -> pd.DataFrame:
+    i = np.arange(rows, dtype=np.int64)
+    dataframe = pd.DataFrame(
+        np.stack([i, i + 1, i + 2, i + 3, i + 4], axis=1),
+        index=pd.date_range(
+            start=pd.Timestamp(1627776000000 + timestamp_offset * 1000, unit="ms", tz="UTC"),
+            periods=rows,
+            freq="1s",
+            name="date",
+        ),
+        columns=pd.MultiIndex.from_product([["open", "high", "low", "close", "volume"], [symbol]]),
+    )
     dataframe.iloc[:leading_nan_rows, :3] = math.nan
-    columns = pd.MultiIndex.from_product([["open", "high", "low", "close", "volume"], [symbol]])
-    dataframe.columns = columns
-    return MultiAssetCandleData(dataframe)
+    return dataframe
+
+
+@pytest.fixture(scope="module")
+def btc_eth_candles() -> MultiAssetCandleData:
+    """100 rows of BTC combined with 100 rows of ETH, shared by the tests of a module. Do not modify."""
+    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
+    candles.combine(generate_candle_data(Symbol.ETH, timestamp_offset=0, rows=100))
+    return candles
+
+
+@pytest.fixture
+def btc_eth_candles_mut(btc_eth_candles: MultiAssetCandleData) -> MultiAssetCandleData:
+    """A private copy of `btc_eth_candles` for tests that modify it."""
+    return copy.deepcopy(btc_eth_candles)
@@ -0,0 +1,32 @@
+from chartrider.tests.utils.data.conftest import generate_candle_data
+from chartrider.utils.data import Indicator
+from chartrider.utils.symbols import Symbol
+
+
+def test_indicator_set_length_keeps_original():
+    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
+    indicator = Indicator(candles.close)
+
+    indicator.set_length(50)
+    assert len(indicator) == 50
+    assert indicator[Symbol.BTC][-1] == 52
+    assert indicator.original_indicator.length == 100
+    assert indicator.original_indicator[Symbol.BTC][-1] == 102
+
+    indicator.set_length(80)
+    assert len(indicator) == 80
+    assert indicator[Symbol.BTC][-1] == 82
+    assert indicator.original_indicator.length == 100
+
+
+def test_indicator_get_last_returns_a_new_array_each_call():
+    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
+    indicator = Indicator(candles.close)
+
+    indicator.set_length(50)
+    previous_last = indicator.get_last()
+    indicator.set_length(80)
+    current_last = indicator.get_last()
+
+    assert previous_last.tolist() == [52]
+    assert current_last.tolist() == [82]
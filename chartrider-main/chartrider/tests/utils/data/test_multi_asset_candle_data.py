@@ -8,10 +8,8 @@ from chartrider.utils.data import MultiAssetCandleData
 from chartrider.utils.symbols import Symbol
 
 
-def test_combine_candle_data_basic():
-    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
-    eth = generate_candle_data(Symbol.ETH, timestamp_offset=0, rows=100)
-    candles.combine(eth)
+def test_combine_candle_data_basic(btc_eth_candles: MultiAssetCandleData):
+    candles = btc_eth_candles
     assert len(candles.open.symbols) == 2
     assert len(candles.df.columns) == 10
     assert len(candles.df) == 100
@@ -44,11 +42,8 @@ def test_combine_candle_override():
     assert candles.open[Symbol.BTC][149] == 99
 
 
-def test_combine_candle_override_with_multi_symbols():
-    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
-    eth = generate_candle_data(Symbol.ETH, timestamp_offset=0, rows=100)
-    candles.combine(eth)
-
+def test_combine_candle_override_with_multi_symbols(btc_eth_candles_mut: MultiAssetCandleData):
+    candles = btc_eth_candles_mut
     btc_2 = generate_candle_data(Symbol.BTC, timestamp_offset=50, rows=100)
     candles.combine(btc_2)
     assert len(candles.df) == 150
@@ -90,11 +85,8 @@ def test_first_valid_index():
     assert candles.first_valid_index() == 10
 
 
-def test_ohlcv_last():
-    candles = generate_candle_data(Symbol.BTC, timestamp_offset=0, rows=100)
-    eth = generate_candle_data(Symbol.ETH, timestamp_offset=0, rows=100)
-    candles.combine(eth)
-    o, h, l, c, v, t = candles.ohlcv_last(Symbol.BTC)  # noqa
+def test_ohlcv_last(btc_eth_candles: MultiAssetCandleData):
+    o, h, l, c, v, t = btc_eth_candles.ohlcv_last(Symbol.BTC)  # noqa
     assert o == 99
     assert h == 100
     assert l == 101
@@ -10,15 +10,19 @@ from chartrider.utils.symbols import Symbol
 
 
 class BoundedArray:
+    # created for every per-symbol lookup, so keep instances small
+    __slots__ = ("__array", "__current_length")
+
     def __init__(self, array: np.ndarray, length: int):
         self.__array = array
         self.__current_length = length
 
     def __getitem__(self, key) -> Any:
         if isinstance(key, int):
+            length = self.__current_length
             if key < 0:
-                key += self.__current_length
-            if key >= self.__current_length or key < 0:
+                key += length
+            if key >= length or key < 0:
                 raise IndexError
             return self.__array[key]
         elif isinstance(key, slice):
@@ -42,20 +46,30 @@ class SymbolColumnData:
         index: pd.DatetimeIndex,
         length: int | None = None,
     ):
-        self.__data_array = data_array
+        # column-major, so that the per-symbol columns handed out by __getitem__ are contiguous;
+        # a no-op for the candle data, which already is
+        self.__data_array = np.asfortranarray(data_array)
         self.__column_map = column_map
         self.__index = index
         self.__current_length = length or len(data_array)
+        # filled lazily, as most instances are short-lived views that never look up indices
+        self.__column_indices: dict[tuple[Symbol, ...] | None, np.ndarray] = {}
 
     def __getitem__(self, symbol: Symbol) -> BoundedArray:
         col_index = self.__column_map[symbol]
         selected_column = self.__data_array[:, col_index]
         return BoundedArray(selected_column, self.__current_length)
 
-    def get_column_indices(self, symbols: list[Symbol] | None) -> list[int]:
-        return (
-            list(self.__column_map.values()) if symbols is None else [self.__column_map[symbol] for symbol in symbols]
-        )
+    def get_column_indices(self, symbols: list[Symbol] | None) -> np.ndarray:
+        key = None if symbols is None else tuple(symbols)
+        indices = self.__column_indices.get(key)
+        if indices is None:
+            indices = np.array(
+                list(self.__column_map.values()) if key is None else [self.__column_map[symbol] for symbol in key],
+                dtype=np.intp,
+            )
+            self.__column_indices[key] = indices
+        return indices
 
     def get_last(self, symbols: list[Symbol] | None = None) -> np.ndarray:
         return self.__data_array[self.__current_length - 1, self.get_column_indices(symbols)]
@@ -67,6 +81,17 @@ class SymbolColumnData:
         sliced = self.__data_array[: self.__current_length, self.get_column_indices(symbols)]
         return pd.DataFrame(sliced, columns=symbols or self.symbols, index=self.__index[: self.__current_length])
 
+    def sliced(self, start: float, end: float) -> SymbolColumnData:
+        """The rows between the `start` and `end` timestamps in ms, both inclusive."""
+        index = self.__index[: self.__current_length]
+        lo = index.searchsorted(pd.to_datetime(start, unit="ms", utc=True), side="left")
+        hi = index.searchsorted(pd.to_datetime(end, unit="ms", utc=True), side="right")
+        return SymbolColumnData(
+            data_array=self.__data_array[lo:hi, self.get_column_indices(None)],
+            column_map={symbol: i for i, symbol in enumerate(self.__column_map)},
+            index=index[lo:hi],
+        )
+
     def resized(self, length: int) -> SymbolColumnData:
         data = SymbolColumnData(self.__data_array, self.__column_map, index=self.__index)
         data.set_length(length)
@@ -94,16 +119,21 @@ class SymbolColumnData:
 
 class MultiAssetData:
     def __init__(self, df: pd.DataFrame):
+        # per-symbol column positions derived from `column_map`, for subclasses to fill lazily
+        self._symbol_columns: dict[Symbol, tuple[int, ...]] = dict()
         self.__initialize(df)
 
     def __create_column_map(self, columns: pd.MultiIndex) -> dict[str, dict[Symbol, int]]:
         column_map = defaultdict(dict)
-        for idx, (col_name, symbol) in enumerate(columns):
+        # zipping the level values is cheaper than iterating the MultiIndex, which builds its tuples first
+        level_values = zip(columns.get_level_values(0).tolist(), columns.get_level_values(1).tolist())
+        for idx, (col_name, symbol) in enumerate(level_values):
             column_map[col_name][symbol] = idx
         return column_map
 
     def __convert_to_timestamp(self, index: pd.DatetimeIndex) -> np.ndarray:
-        return index.values.astype(np.int64) // 10**6
+        # asi8 is a view of the nanoseconds, so only the division allocates
+        return index.asi8 // 10**6
 
     def set_length(self, length: int):
         if length > len(self._original_df):
@@ -118,10 +148,12 @@ class MultiAssetData:
         if new_data.df.empty:
             raise ValueError("Cannot combine with empty data")
         if self._original_df.empty:
-            self._original_df = new_data.df
+            self.__initialize(new_data.df)
+        elif (appended := _append_if_continuation(self._original_df, new_data.df)) is not None:
+            # same columns as before, so the column map is still valid
+            self.__initialize(appended, columns_changed=False)
         else:
-            self._original_df = new_data.df.combine_first(self._original_df)
-        self.__initialize(self._original_df)
+            self.__initialize(new_data.df.combine_first(self._original_df))
 
     def truncate_to(self, desired_length: int):
         if desired_length <= 0:
@@ -132,26 +164,37 @@ class MultiAssetData:
         candles_to_truncate = len(self._original_df) - desired_length
         if self._current_length < candles_to_truncate:
             raise ValueError(f"Cannot truncate more than {self._current_length=}.")
-        previous_length = self._current_length
-        self.__initialize(self._original_df.tail(desired_length))
-        self._current_length = previous_length - candles_to_truncate
-
-    def __initialize(self, df: pd.DataFrame) -> None:
+        # the columns stay the same, so slice the existing arrays instead of rebuilding them from the dataframe
+        self._original_df = self._original_df.iloc[candles_to_truncate:]
+        self._data_array = self._data_array[candles_to_truncate:]
+        self._index = self._index[candles_to_truncate:]
+        self.timestamp_array = self.timestamp_array[candles_to_truncate:]
+        self._current_length -= candles_to_truncate
+
+    def __initialize(self, df: pd.DataFrame, columns_changed: bool = True) -> None:
         self._original_df = df
-        self._data_array = df.values
+        # Column-major, so that each (field, symbol) column is contiguous and the columns of a field, sorted next
+        # to each other, form one contiguous block. `values` often already is laid out that way, which makes this
+        # a no-op; otherwise the one copy here saves a strided walk on every per-symbol read afterwards.
+        self._data_array = np.asfortranarray(df.values)
         self._current_length = len(df)
         self._index = cast(pd.DatetimeIndex, df.index)
         if not df.empty:
             assert isinstance(df.index, pd.DatetimeIndex)
             assert isinstance(df.columns, pd.MultiIndex)
             self.timestamp_array = self.__convert_to_timestamp(df.index)
-            self.column_map = self.__create_column_map(df.columns)
+            if columns_changed:
+                self.column_map = self.__create_column_map(df.columns)
+                self._symbol_columns = dict()
         else:
             self.timestamp_array = np.array([], dtype=np.int64)
             self.column_map = dict()
+            self._symbol_columns = dict()
 
     @property
     def df(self) -> pd.DataFrame:
+        if self._current_length == len(self._original_df):
+            return self._original_df
         return self._original_df.iloc[: self._current_length]
 
     @property
@@ -195,9 +238,15 @@ class MultiAssetCandleData(MultiAssetData):
         return SymbolColumnData(self._data_array, self.column_map["volume"], self._index, self._current_length)
 
     def ohlcv_last(self, symbol: Symbol) -> tuple[float, float, float, float, float, int]:
-        indices = tuple(self.column_map[component][symbol] for component in ["open", "high", "low", "close", "volume"])
-        ohlcv_tuple = tuple(self._data_array[self._current_length - 1, indices]) + (self.timestamp_last,)
-        return ohlcv_tuple  # type: ignore
+        # called on every tick, so read the five scalars directly instead of fancy-indexing a temporary array
+        if (indices := self._symbol_columns.get(symbol)) is None:
+            indices = tuple(
+                self.column_map[component][symbol] for component in ["open", "high", "low", "close", "volume"]
+            )
+            self._symbol_columns[symbol] = indices
+        o, h, l, c, v = indices  # noqa: E741
+        row = self._data_array[self._current_length - 1]
+        return row[o], row[h], row[l], row[c], row[v], self.timestamp_last
 
 
 class Indicator:
@@ -210,7 +259,8 @@ class Indicator:
     ):
         self.name: str | None = name
         self.original_indicator = indicator
-        self.resized_indicator = indicator
+        # a separate view that shares the data array, so that resizing does not affect the original indicator
+        self.resized_indicator = indicator.resized(indicator.length)
         self.plot = plot
         self.figure_id = figure_id
 
@@ -221,24 +271,55 @@ class Indicator:
         return self.resized_indicator.get_last(symbols)
 
     def set_length(self, length: int) -> None:
-        self.resized_indicator = self.original_indicator.resized(length)
+        self.resized_indicator.set_length(length)
 
     def first_valid_index(self) -> int:
         return self.original_indicator.first_valid_index()
 
     def sliced(self, start: float, end: float) -> Indicator:
-        df = self.original_indicator.df()
-        start_date = pd.to_datetime(start, unit="ms", utc=True)
-        end_date = pd.to_datetime(end, unit="ms", utc=True)
-        sliced_df = df.loc[start_date:end_date]
-        indicator = SymbolColumnData.from_dataframe(sliced_df)
+        indicator = self.original_indicator.sliced(start, end)
         return Indicator(indicator, self.plot, self.figure_id, self.name)
 
     def __len__(self) -> int:
         return self.resized_indicator.length
 
 
+def _append_if_continuation(df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame | None:
+    """
+    The result of `new_df.combine_first(df)` when `new_df` continues `df` with the same columns,
+    possibly replacing some of its last rows, which is how new candles arrive. `None` otherwise.
+    """
+    if not df.columns.equals(new_df.columns):
+        return None
+    if not (df.index.is_monotonic_increasing and new_df.index.is_monotonic_increasing):
+        return None
+    cut = df.index.searchsorted(new_df.index[0])
+    overlap = len(df) - cut
+    if overlap > len(new_df) or not df.index[cut:].equals(new_df.index[:overlap]):
+        return None
+    # combine_first would fill missing values of the replacing rows from the old ones
+    if overlap > 0 and new_df.iloc[:overlap].isna().values.any():
+        return None
+    return pd.concat([df.iloc[:cut], new_df])
+
+
+_FIRST_VALID_INDEX_BLOCK_ROWS = 64
+
+
 def _first_valid_index(data_array: np.ndarray) -> int:
-    mask = np.isnan(data_array)
-    first_valid_index = np.argmax(~mask, axis=0)
-    return np.max(first_valid_index)
+    """The largest, over all columns, of the first row holding a non-NaN value. All-NaN columns count as 0."""
+    # Leading NaNs are usually a short prefix, so scan blocks of growing size and stop as soon as every column
+    # has a valid value, instead of building NaN masks over the whole array.
+    first_valid = np.zeros(data_array.shape[1:], dtype=np.int64)
+    found = np.zeros(data_array.shape[1:], dtype=bool)
+    start, block_rows = 0, _FIRST_VALID_INDEX_BLOCK_ROWS
+    while start < len(data_array):
+        valid = ~np.isnan(data_array[start : start + block_rows])
+        newly_found = valid.any(axis=0) & ~found
+        first_valid[newly_found] = start + np.argmax(valid, axis=0)[newly_found]
+        found |= newly_found
+        if found.all():
+            break
+        start += block_rows
+        block_rows *= 2
+    return int(first_valid.max(initial=0))
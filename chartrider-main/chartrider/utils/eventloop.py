@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Awaitable, Callable, Coroutine, Self, TypeVar
 
@@ -8,6 +9,7 @@ T = TypeVar("T")
 class AsyncEventLoop:
     def __init__(self) -> None:
         self.loop = asyncio.new_event_loop()
+        self.loop_thread: threading.Thread | None = None
         self.executor: ThreadPoolExecutor | None = None
 
     def add_task(self, task: Coroutine[Any, Any, None]):
@@ -24,8 +26,10 @@ class AsyncEventLoop:
             asyncio.set_event_loop(self.loop)
             self.loop.run_forever()
 
+        # the loop gets a thread of its own, so that all `num_threads` workers are left for `perform`
+        self.loop_thread = threading.Thread(target=loop_runner, daemon=True)
+        self.loop_thread.start()
         self.executor = ThreadPoolExecutor(max_workers=num_threads)
-        self.executor.submit(loop_runner)
         return self
 
     async def perform(self, sync_func: Callable[..., T], *args) -> T:
@@ -37,7 +41,11 @@ class AsyncEventLoop:
 
         self.loop.call_soon_threadsafe(self.loop.stop)
 
+        if self.loop_thread is not None:
+            self.loop_thread.join()
+
         if self.executor is not None:
             self.executor.shutdown(wait=True)
 
+        self.loop_thread = None
         self.executor = None
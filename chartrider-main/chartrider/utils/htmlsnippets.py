@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import cache
+
 
 class HTMLElement:
     def __init__(
         self,
         tag: str,
-        children: HTMLElement | str | list[HTMLElement | str] = [],
+        children: HTMLElement | str | list[HTMLElement | str] | None = None,
         href: str | None = None,
         style: dict[str, str] | None = None,
         margin_bottom: float | None = None,
@@ -41,7 +43,9 @@ class HTMLElement:
             self.style["justify-content"] = "space-between"
 
         # If 'children' is a single HTMLElement or str, wrap it in a list
-        if isinstance(children, (HTMLElement, str)):
+        if children is None:
+            self.children = []
+        elif isinstance(children, (HTMLElement, str)):
             self.children = [children]
         else:
             self.children = children
@@ -52,16 +56,24 @@ class HTMLElement:
     def __render_style(self) -> str:
         if not self.style:
             return ""
-        return 'style="' + "; ".join([f"{key}: {value}" for key, value in self.style.items()]) + '"'
+        # keyed by the current items, as `style` is a plain dict that may change after construction
+        return _render_style(tuple(self.style.items()))
 
     def render(self) -> str:
+        # collect the pieces of the whole tree and join once, instead of joining again at every nesting level
+        parts: list[str] = []
+        self._render_into(parts)
+        return "".join(parts)
+
+    def _render_into(self, parts: list[str]) -> None:
         href_string = f'href="{self.href}"' if self.href else ""
-        start_tag = f"<{self.tag} {self.__render_style()} {href_string}".strip() + ">"
-        children_html = "".join(
-            [child.render() if isinstance(child, HTMLElement) else str(child) for child in self.children]
-        )
-        end_tag = f"</{self.tag}>"
-        return f"{start_tag}{children_html}{end_tag}"
+        parts.append(f"<{self.tag} {self.__render_style()} {href_string}".strip() + ">")
+        for child in self.children:
+            if isinstance(child, HTMLElement):
+                child._render_into(parts)
+            else:
+                parts.append(str(child))
+        parts.append(f"</{self.tag}>")
 
     def __str__(self):
         return self.render()
@@ -109,6 +121,12 @@ class HTMLElement:
         )
 
 
+@cache
+def _render_style(items: tuple[tuple[str, str], ...]) -> str:
+    # most elements share one of a few styles, e.g. the ones of the h1/h2/h3 helpers
+    return 'style="' + "; ".join([f"{key}: {value}" for key, value in items]) + '"'
+
+
 class BorderStyle:
     def __init__(self, color: str, width: float):
         self.color = color
@@ -6,6 +6,34 @@ import click
 from chartrider.utils.htmlsnippets import HTMLElement
 
 
+def _html_template(element: HTMLElement, *placeholders: str) -> str:
+    """Renders `element` once, turning each of `placeholders` into a positional `str.format` field."""
+    template = element.render().replace("{", "{{").replace("}", "}}")
+    for i, placeholder in enumerate(placeholders):
+        template = template.replace(placeholder, f"{{{i}}}")
+    return template
+
+
+# The full html elements have a fixed structure, so they are rendered once and only filled in per row.
+_H1_TEMPLATE = _html_template(HTMLElement.h1("__TEXT__"), "__TEXT__")
+_H2_TEMPLATE = _html_template(HTMLElement.h2("__TEXT__"), "__TEXT__")
+_H3_TEMPLATE = _html_template(HTMLElement.h3("__TEXT__"), "__TEXT__")
+_KEY_VALUE_TEMPLATE = _html_template(
+    HTMLElement(
+        "code",
+        children=[
+            HTMLElement("strong", children="__KEY__"),
+            HTMLElement("span", children="__VALUE__", style=dict(color="__COLOR__")),
+        ],
+        justify_space_between=True,
+        margin_horizontal=0.5,
+    ),
+    "__KEY__",
+    "__VALUE__",
+    "__COLOR__",
+)
+
+
 class PrettyPrintMode(Enum):
     terminal = auto()
     light_html = auto()  # for telegram
@@ -35,7 +63,7 @@ class PrettyPrint:
             self.__builder_string += ret
             return
         if self.full_html:
-            ret = HTMLElement.h1(text).render() if divider == "=" else HTMLElement.h2(text).render()
+            ret = (_H1_TEMPLATE if divider == "=" else _H2_TEMPLATE).format(text)
             self.__builder_string += ret
             return
         text = f" {text} "
@@ -50,7 +78,7 @@ class PrettyPrint:
             self.__builder_string += ret
             return
         if self.full_html:
-            ret = HTMLElement.h3(text).render()
+            ret = _H3_TEMPLATE.format(text)
             self.__builder_string += ret
             return
         text = click.style(text, underline=True)
@@ -77,15 +105,7 @@ class PrettyPrint:
             return
         if self.full_html:
             color = (force_color or ("green" if value > 0 else "red")) if colorize else "black"
-            ret = HTMLElement(
-                "code",
-                children=[
-                    HTMLElement("strong", children=key),
-                    HTMLElement("span", children=value_str, style=dict(color=color)),
-                ],
-                justify_space_between=True,
-                margin_horizontal=0.5,
-            ).render()
+            ret = _KEY_VALUE_TEMPLATE.format(key, value_str, color)
             self.__builder_string += ret
             return
 
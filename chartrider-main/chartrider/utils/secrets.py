@@ -1,4 +1,5 @@
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
@@ -21,7 +22,14 @@ class Secret(BaseSettings):
         return bool(self.api_key) and bool(self.secret_key)
 
     def hash(self) -> str:
-        return hashlib.md5(f"{self.api_key}{self.secret_key}".encode()).hexdigest()
+        return _hash_keys(self.api_key, self.secret_key)
+
+
+@lru_cache(maxsize=16)
+def _hash_keys(api_key: str, secret_key: str) -> str:
+    # keyed by the keys themselves: the fields of a Secret are not frozen, and caching on the model
+    # would make it compare unequal to an otherwise identical one
+    return hashlib.md5(f"{api_key}{secret_key}".encode()).hexdigest()
 
 
 class SecretStore:
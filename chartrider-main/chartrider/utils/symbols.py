@@ -1,4 +1,5 @@
 from enum import StrEnum, auto
+from functools import lru_cache
 
 
 class Symbol(StrEnum):
@@ -283,7 +284,9 @@ class Symbol(StrEnum):
         return "USDT"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def decode(value: str | None) -> "Symbol":
+        # called by the model validators on every order and position; the distinct inputs are few
         if not value:
             raise ValueError("Value is empty or None.")
         if ":" in value:
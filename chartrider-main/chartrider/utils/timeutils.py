@@ -1,7 +1,10 @@
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, TypeAlias
+from zoneinfo import ZoneInfo
 
-import pytz
+import numpy as np
 from ccxt import Exchange
 
 if TYPE_CHECKING:
@@ -10,25 +13,37 @@ if TYPE_CHECKING:
 Timestamp: TypeAlias = int  # unit: ms
 TimeDuration: TypeAlias = int  # unit: ms
 
+_LOCAL_TIMEZONE = ZoneInfo("Asia/Seoul")
+_LOCAL_UTC_OFFSET = "+0900"
+_LOCAL_UTC_OFFSET_MS = 9 * 3_600_000
+# zero-padded strings for the month, day, hour, minute and second fields; indexing is cheaper than a format spec
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+# 1989-01-01 00:00 local time; the local timezone observed daylight saving time until 1988
+_LOCAL_FIXED_OFFSET_SINCE = 599_583_600_000
+# timestamps below this are taken to be in seconds rather than milliseconds
+_MS_THRESHOLD = 10**12
+
 
 class TimeUtils:
     @staticmethod
     def timestamp_in_ms(dt: datetime | None = None) -> Timestamp:
         if dt is None:
-            dt = datetime.now(pytz.utc)
+            # avoids building an aware datetime just to read the clock
+            return time.time_ns() // 1_000_000
         return int(dt.timestamp() * 1000)
 
     @staticmethod
     def timestamp_to_datetime(
         timestamp: Timestamp, truncate_to_minutes: bool = False, local_timezone: bool = True
     ) -> datetime:
-        timestamp = TimeUtils.convert_to_ms_if_needed(timestamp)
-
-        if local_timezone:
-            tz = pytz.timezone("Asia/Seoul")
-        else:
-            tz = pytz.utc
+        # convert_to_ms_if_needed, inlined as this is called for every candle by some strategies
+        if timestamp < _MS_THRESHOLD:
+            timestamp = timestamp * 1000
 
+        tz = _LOCAL_TIMEZONE if local_timezone else timezone.utc
+        if truncate_to_minutes and timestamp >= 0:
+            # utc offsets since the epoch are whole minutes, so truncating before conversion gives the same result
+            return datetime.fromtimestamp(timestamp // 60_000 * 60, tz=tz)
         ret = datetime.fromtimestamp(timestamp / 1000, tz=tz)
         if truncate_to_minutes:
             return ret.replace(second=0, microsecond=0)
@@ -43,13 +58,33 @@ class TimeUtils:
         date = TimeUtils.timestamp_to_datetime(timestamp)
         if isoformat:
             return date.isoformat()
+        # formatted from the fields, which is several times cheaper than strftime
+        if compact:
+            return (
+                f"{date.year:04d}.{_TWO_DIGITS[date.month]}.{_TWO_DIGITS[date.day]} "
+                f"{_TWO_DIGITS[date.hour]}:{_TWO_DIGITS[date.minute]}"
+            )
+        if date.year < 1989:  # the local timezone observed daylight saving time until 1988
+            return date.strftime("%Y-%m-%d %H:%M:%S %z")
+        return (
+            f"{date.year}-{_TWO_DIGITS[date.month]}-{_TWO_DIGITS[date.day]} "
+            f"{_TWO_DIGITS[date.hour]}:{_TWO_DIGITS[date.minute]}:{_TWO_DIGITS[date.second]} {_LOCAL_UTC_OFFSET}"
+        )
+
+    @staticmethod
+    def timestamps_to_datestrings(timestamps: np.ndarray, compact: bool = False) -> list[str]:
+        """Vectorized `timestamp_to_datestring` over an array of timestamps."""
+        timestamps_ms = TimeUtils.convert_to_ms_if_needed_array(timestamps)
+        if timestamps_ms.size and timestamps_ms.min() < _LOCAL_FIXED_OFFSET_SINCE:
+            return [TimeUtils.timestamp_to_datestring(int(timestamp), compact=compact) for timestamp in timestamps]
+        local = (timestamps_ms + _LOCAL_UTC_OFFSET_MS).astype("datetime64[ms]")
         if compact:
-            return date.strftime("%Y.%m.%d %H:%M")
-        return date.strftime("%Y-%m-%d %H:%M:%S %z")
+            return [s.replace("-", ".").replace("T", " ") for s in np.datetime_as_string(local, unit="m").tolist()]
+        return [s.replace("T", " ") + " " + _LOCAL_UTC_OFFSET for s in np.datetime_as_string(local, unit="s").tolist()]
 
     @staticmethod
     def timeframe_in_ms(timeframe: str) -> TimeDuration:
-        return Exchange.parse_timeframe(timeframe) * 1000
+        return _timeframe_in_ms(timeframe)
 
     @staticmethod
     def round_down_to_timeframe(timestamp: Timestamp, timeframe: "Timeframe") -> Timestamp:
@@ -59,17 +94,24 @@ class TimeUtils:
     @staticmethod
     def round_to_nearest_timeframe_in_minutes(timestamp: Timestamp, timeframe_in_min: int) -> Timestamp:
         timeframe_ms = timeframe_in_min * 60_000
-        remainder = timestamp % timeframe_ms
-        half_timeframe_ms = timeframe_ms // 2
-
-        if remainder >= half_timeframe_ms:
-            return timestamp + (timeframe_ms - remainder)
-        else:
-            return timestamp - remainder
+        # shifting by half a timeframe and rounding down rounds to the nearest, with halves going up
+        return (timestamp + timeframe_ms // 2) // timeframe_ms * timeframe_ms
 
     @staticmethod
     def convert_to_ms_if_needed(timestamp: int) -> Timestamp:
         # Check if timestamp is in seconds
-        if timestamp < 10**12:
+        if timestamp < _MS_THRESHOLD:
             timestamp = timestamp * 1000
         return timestamp
+
+    @staticmethod
+    def convert_to_ms_if_needed_array(timestamps: np.ndarray) -> np.ndarray:
+        """Vectorized `convert_to_ms_if_needed` over an array of timestamps."""
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        return np.where(timestamps < _MS_THRESHOLD, timestamps * 1000, timestamps)
+
+
+@lru_cache(maxsize=64)
+def _timeframe_in_ms(timeframe: str) -> TimeDuration:
+    # only a handful of distinct timeframes are ever parsed
+    return Exchange.parse_timeframe(timeframe) * 1000
@@ -1,4 +1,5 @@
 import asyncio
+import base64
 import pickle
 import sys
 
@@ -11,7 +12,7 @@ from chartrider.telegram.context import TelegramUserContext
 
 if __name__ == "__main__":
     try:
-        user_context_bytes = bytes.fromhex(sys.argv[1])
+        user_context_bytes = base64.b64decode(sys.argv[1])
         user_context = pickle.loads(user_context_bytes)
         assert isinstance(user_context, TelegramUserContext)
         assert user_context.strategy_preset is not None
@@ -8,6 +8,11 @@ from loguru import logger
 from chartrider.settings import LOG_PATH
 from chartrider.worker.rpc import RpcWorkerServer
 
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
 
 async def attach_signal_handlers():
     """Attach signal handlers to the event loop."""
@@ -40,4 +45,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; the worker runs on the default event loop when it is not installed
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        runner.run(main())
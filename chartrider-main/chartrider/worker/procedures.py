@@ -1,3 +1,5 @@
+import asyncio
+import base64
 import pickle
 import time
 from pathlib import Path
@@ -8,16 +10,33 @@ from docker.models.containers import Container
 from chartrider.settings import ROOT_PATH, settings
 from chartrider.telegram.context import TelegramUserContext
 
+_docker_client: docker.DockerClient | None = None
+
+# container_id -> (expires at, exists); only for the batched checks, container_exists is never cached
+_CONTAINER_EXISTS_TTL = 5.0
+_container_exists_cache: dict[str, tuple[float, bool]] = {}
+
+
+def get_docker_client() -> docker.DockerClient:
+    """Returns the docker client shared by all procedures, so the daemon connection is set up only once."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
+
 
 async def create_isolated_container(user_context: TelegramUserContext) -> str:
-    client = docker.from_env()
-    user_context_bytes = pickle.dumps(user_context).hex()
+    client = get_docker_client()
+    # base64 adds a third to the pickle, where hex would double it
+    user_context_bytes = base64.b64encode(pickle.dumps(user_context)).decode("ascii")
     entrypoint_path = str(Path(__file__).parent.relative_to(ROOT_PATH) / "entrypoint.py")
     command = [
         entrypoint_path,
         user_context_bytes,
     ]
-    container = client.containers.run(
+    # the docker SDK blocks on the daemon, so it runs off the event loop to let other RPCs proceed
+    container = await asyncio.to_thread(
+        client.containers.run,
         f"{settings.ecr_repository}/chartrider:latest",
         command=command,
         detach=True,
@@ -30,26 +49,59 @@ async def create_isolated_container(user_context: TelegramUserContext) -> str:
 
 
 async def kill_container(container_id: str) -> bool:
-    client = docker.from_env()
+    client = get_docker_client()
+    _container_exists_cache.pop(container_id, None)
     try:
-        container = client.containers.get(container_id)
+        container = await asyncio.to_thread(client.containers.get, container_id)
         assert isinstance(container, Container)
         if container.status == "running":
-            container.stop()
-        container.remove()
+            await asyncio.to_thread(container.stop)
+        await asyncio.to_thread(container.remove)
         return True
-    except BaseException:
+    except Exception:
         return False
 
 
 async def container_exists(container_id: str) -> bool:
-    client = docker.from_env()
+    # always asks the daemon: the handlers call this right after creating or killing a container,
+    # and a container that has just crashed must not be reported as running from the cache
+    client = get_docker_client()
     try:
-        container = client.containers.get(container_id)
+        container = await asyncio.to_thread(client.containers.get, container_id)
         assert isinstance(container, Container)
-        if container.status == "running":
-            return True
+        return container.status == "running"
+    except Exception:
         return False
-    except BaseException:
-        return False
-    return True
+
+
+async def containers_running(container_ids: list[str]) -> dict[str, bool]:
+    """
+    Returns whether each container is running, asking the daemon once for all that are not cached.
+    If the daemon cannot be reached, the containers it was asked about are left out of the result, as unknown.
+    """
+    now = time.monotonic()
+    running: dict[str, bool] = {}
+    uncached: list[str] = []
+    for container_id in container_ids:
+        cached = _container_exists_cache.get(container_id)
+        if cached is not None and cached[0] > now:
+            running[container_id] = cached[1]
+        else:
+            uncached.append(container_id)
+    if not uncached:
+        return running
+
+    try:
+        client = get_docker_client()
+        # sparse, or the SDK would inspect each listed container with a request of its own
+        containers = await asyncio.to_thread(client.containers.list, all=True, filters={"id": uncached}, sparse=True)
+    except Exception:
+        # a failed check says nothing about the containers, so neither report nor cache them as dead
+        return running
+    statuses = {str(container.id): container.status for container in containers}
+    for container_id in uncached:
+        # the daemon matches id prefixes, so short ids come back as the full id
+        status = next((status for full_id, status in statuses.items() if full_id.startswith(container_id)), None)
+        running[container_id] = status == "running"
+        _container_exists_cache[container_id] = (now + _CONTAINER_EXISTS_TTL, running[container_id])
+    return running
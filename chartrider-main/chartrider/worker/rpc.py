@@ -9,6 +9,7 @@ from chartrider.settings import rabbitmq_settings as settings
 from chartrider.telegram.context import TelegramUserContext
 from chartrider.worker.procedures import (
     container_exists,
+    containers_running,
     create_isolated_container,
     kill_container,
 )
@@ -42,9 +43,13 @@ class RpcWorkerServer(RpcWorker):
         return self
 
     async def register_all_methods(self) -> None:
-        await self.register_method(create_isolated_container)
-        await self.register_method(container_exists)
-        await self.register_method(kill_container)
+        # each registration is its own broker round-trip, and they do not depend on one another
+        await asyncio.gather(
+            self.register_method(create_isolated_container),
+            self.register_method(container_exists),
+            self.register_method(containers_running),
+            self.register_method(kill_container),
+        )
 
     async def register_method(self, method: Callable[..., Awaitable]) -> None:
         assert self.rpc is not None
@@ -70,6 +75,10 @@ class RpcWorkerClient(RpcWorker):
         assert self.rpc is not None
         return await self.rpc.proxy.container_exists(container_id=container_id)
 
+    async def containers_running(self, container_ids: list[str]) -> dict[str, bool]:
+        assert self.rpc is not None
+        return await self.rpc.proxy.containers_running(container_ids=container_ids)
+
     async def kill_container(self, container_id: str) -> bool:
         assert self.rpc is not None
         return await self.rpc.proxy.kill_container(container_id=container_id)